@@ -0,0 +1,217 @@
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from recipe_generator import cooking_recipe, crafting_recipe, processing_recipe, script_chunks
+from recipe_model import COOKING_KINDS, Recipe
+from recipe_types import REGISTRY
+from script_writer import write_atomic
+
+CSV_FIELDS = ["type", "output", "count", "inputs", "xp", "time", "namespace"]
+DEFAULT_NAMESPACE = "recipes"
+UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+class SpecError(Exception):
+    pass
+
+
+class BatchReport:
+    def __init__(self):
+        self.generated = 0
+        self.errors = []
+
+
+def parse_grid(value):
+    if isinstance(value, list):
+        rows = [[cell or None for cell in row] for row in value]
+    else:
+        rows = [[cell.strip() or None for cell in row.split(";")] for row in value.split("|")]
+    width = max([3] + [len(row) for row in rows])
+    rows += [[] for _ in range(3 - len(rows))]
+    return [row + [None] * (width - len(row)) for row in rows]
+
+
+def parse_list(value):
+    if isinstance(value, list):
+        return value
+    return [item.strip() for item in value.split(";") if item.strip()]
+
+
+def recipe_from_spec(spec):
+    kind = spec.get("type")
+    output_item = spec.get("output")
+    if not kind or not output_item:
+        raise SpecError("spec needs a 'type' and an 'output'")
+    count = int(spec.get("count") or 1)
+
+    if kind == "shaped":
+        if spec.get("pattern") and spec.get("key"):
+            key = spec["key"]
+            return Recipe(kind, output_item, count, key.values(), pattern=spec["pattern"], key=key)
+        grid = parse_grid(spec.get("grid") or spec.get("inputs") or [])
+        if not any(any(row) for row in grid):
+            raise SpecError("shaped recipe has no inputs")
+        return crafting_recipe(grid, output_item, count, shaped=True)
+
+    if kind == "shapeless":
+        inputs = parse_list(spec.get("inputs") or [])
+        if not inputs:
+            raise SpecError("shapeless recipe has no inputs")
+        return Recipe(kind, output_item, count, inputs)
+
+    if kind in COOKING_KINDS:
+        input_item = spec.get("input") or spec.get("inputs")
+        if isinstance(input_item, list):
+            input_item = input_item[0] if input_item else None
+        if not input_item:
+            raise SpecError(f"{kind} recipe has no input")
+        xp = float(spec["xp"]) if spec.get("xp") not in (None, "") else 0.0
+        cook_time = int(spec["time"]) if spec.get("time") not in (None, "") else 200
+        return cooking_recipe(kind, input_item, output_item, count, xp, cook_time)
+
+    recipe_type = REGISTRY.get(kind)
+    if recipe_type is None:
+        raise SpecError(f"unknown recipe type '{kind}'")
+    inputs = parse_list(spec.get("inputs") or spec.get("input") or [])
+    if not inputs:
+        raise SpecError(f"{kind} recipe has no inputs")
+    if "inputs" not in recipe_type.args and len(inputs) > recipe_type.input_slots():
+        raise SpecError(f"{kind} recipe takes at most {recipe_type.input_slots()} inputs")
+    xp = float(spec["xp"]) if recipe_type.has("xp") and spec.get("xp") not in (None, "") else None
+    time = int(spec["time"]) if recipe_type.has("time") and spec.get("time") not in (None, "") else None
+    return processing_recipe(kind, inputs, output_item, count, xp, time)
+
+
+def read_specs(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.endswith(".csv"):
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+        else:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if line:
+                    yield line_no, line
+
+
+def generate_recipes(specs, report):
+    for line_no, spec in specs:
+        try:
+            if isinstance(spec, str):
+                spec = json.loads(spec)
+            recipe = recipe_from_spec(spec)
+        except (SpecError, ValueError, TypeError, AttributeError) as e:
+            report.errors.append((line_no, str(e)))
+            continue
+        report.generated += 1
+        yield recipe
+
+
+def write_script(specs, output_path, report):
+    recipes = generate_recipes(specs, report)
+    write_atomic(output_path, script_chunks(recipes, output_path.endswith('.js')))
+
+
+def spec_namespace(spec):
+    if not isinstance(spec, dict):
+        return DEFAULT_NAMESPACE
+    namespace = spec.get("namespace")
+    if not namespace:
+        output_item = spec.get("output") or ""
+        namespace = output_item.split(":", 1)[0] if ":" in output_item else DEFAULT_NAMESPACE
+    return UNSAFE_NAME_RE.sub("_", namespace)
+
+
+def shard_specs(specs):
+    shards = {}
+    for line_no, spec in specs:
+        if isinstance(spec, str):
+            try:
+                spec = json.loads(spec)
+            except ValueError:
+                pass
+        shards.setdefault(spec_namespace(spec), []).append((line_no, spec))
+    return shards
+
+
+def render_shard(namespace, specs, output_dir):
+    report = BatchReport()
+    recipes = list(generate_recipes(specs, report))
+    if recipes:
+        write_atomic(os.path.join(output_dir, f"{namespace}.js"), script_chunks(recipes, True))
+    return namespace, report.generated, report.errors
+
+
+def run(spec_path, output_path, out=sys.stderr):
+    report = BatchReport()
+    start = time.perf_counter()
+    write_script(read_specs(spec_path), output_path, report)
+    elapsed = time.perf_counter() - start
+
+    for line_no, message in report.errors:
+        print(f"{spec_path}:{line_no}: {message}", file=out)
+    rate = report.generated / elapsed if elapsed > 0 else 0.0
+    print(f"Generated {report.generated} recipes into {output_path} in {elapsed:.3f}s "
+          f"({rate:,.0f} recipes/s, {len(report.errors)} skipped)", file=out)
+    return 1 if report.errors else 0
+
+
+def run_sharded(spec_path, output_dir, jobs=None, out=sys.stderr):
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+    shards = shard_specs(read_specs(spec_path))
+    order = sorted(shards, key=lambda namespace: (-len(shards[namespace]), namespace))
+
+    if jobs == 1 or len(shards) <= 1:
+        results = [render_shard(namespace, shards[namespace], output_dir) for namespace in order]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [pool.submit(render_shard, namespace, shards[namespace], output_dir) for namespace in order]
+            results = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    generated = 0
+    written = 0
+    errors = []
+    skipped = []
+    for namespace, shard_generated, shard_errors in sorted(results):
+        generated += shard_generated
+        errors.extend(shard_errors)
+        if shard_generated:
+            written += 1
+        else:
+            skipped.append(namespace)
+    for line_no, message in sorted(errors):
+        print(f"{spec_path}:{line_no}: {message}", file=out)
+    for namespace in skipped:
+        print(f"{spec_path}: no valid recipes for {namespace}.js, not written", file=out)
+    rate = generated / elapsed if elapsed > 0 else 0.0
+    print(f"Generated {generated} recipes into {written} files under {output_dir} in {elapsed:.3f}s "
+          f"({rate:,.0f} recipes/s, {len(errors)} skipped)", file=out)
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="main.py batch",
+        description="Generate a KubeJS ServerEvents.recipes script from CSV/JSONL recipe specs."
+    )
+    parser.add_argument("specs", help="CSV (columns: " + ",".join(CSV_FIELDS) + ") or JSONL spec file")
+    parser.add_argument("-o", "--output", default="recipes.js", help="script to write (default: recipes.js)")
+    parser.add_argument("-d", "--out-dir",
+                        help="write one <namespace>.js per namespace into this directory instead of a single script")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="worker processes for --out-dir (default: CPU count)")
+    args = parser.parse_args(argv)
+    if args.out_dir:
+        return run_sharded(args.specs, args.out_dir, args.jobs)
+    return run(args.specs, args.output)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import os
+import random
+from recipe_generator import cooking_recipe, crafting_recipe, script_chunks
+from script_writer import write_atomic
+
+NAMESPACES = ["minecraft", "create", "mekanism", "thermal", "immersiveengineering", "ae2", "botania", "farmersdelight"]
+MATERIALS = ["iron", "gold", "copper", "diamond", "emerald", "netherite", "stone", "oak", "birch", "coal", "redstone",
+             "quartz", "tin", "lead", "silver", "osmium", "zinc", "brass", "bronze", "steel"]
+SHAPES = ["ingot", "nugget", "block", "plate", "gear", "rod", "dust", "ore", "raw", "sheet", "wire", "planks",
+          "slab", "stairs", "bricks", "pickaxe", "sword", "helmet", "boots", "casing"]
+COOKING_KINDS = ["smelting", "blasting", "smoking", "campfireCooking"]
+
+
+def item_ids(count, seed=0):
+    rng = random.Random(seed)
+    ids = []
+    for i in range(count):
+        namespace = rng.choice(NAMESPACES)
+        name = f"{rng.choice(MATERIALS)}_{rng.choice(SHAPES)}"
+        if i >= len(MATERIALS) * len(SHAPES):
+            name += f"_{i}"
+        ids.append(f"{namespace}:{name}")
+    return ids
+
+
+def recipes(count, seed=0):
+    rng = random.Random(seed)
+    items = item_ids(max(200, count // 10), seed)
+    for i in range(count):
+        output_item = items[i % len(items)]
+        roll = rng.random()
+        if roll < 0.45:
+            grid = [[rng.choice(items) if rng.random() < 0.6 else None for _ in range(3)] for _ in range(3)]
+            grid[1][1] = grid[1][1] or rng.choice(items)
+            yield crafting_recipe(grid, output_item, rng.randint(1, 8), shaped=True)
+        elif roll < 0.7:
+            grid = [[rng.choice(items) for _ in range(rng.randint(1, 3))] for _ in range(3)]
+            yield crafting_recipe(grid, output_item, rng.randint(1, 4), shaped=False)
+        else:
+            yield cooking_recipe(rng.choice(COOKING_KINDS), rng.choice(items), output_item, 1,
+                                 round(rng.random(), 2), rng.choice([100, 200, 400]))
+
+
+def write_items(directory, count, seed=0):
+    file_path = os.path.join(directory, f"items_{count}.txt")
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write("\n".join(item_ids(count, seed)))
+    return file_path
+
+
+def write_script(directory, count, seed=0):
+    file_path = os.path.join(directory, f"recipes_{count}.js")
+    write_atomic(file_path, script_chunks(recipes(count, seed), True))
+    return file_path
@@ -0,0 +1,226 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from bulk_edit import SetXp
+from fixtures import recipes, write_items, write_script
+from item_model import ItemFile
+from matcher import get_matcher
+from recipe_generator import render_recipe
+from recipe_index import parse_query, search_recipes
+from recipe_model import RecipeStore
+from recipe_parser import read_script
+from script_writer import save_full, save_script
+from search_index import ItemSearchIndex, SearchSession
+
+ITEM_SIZES = (1000, 10000, 100000)
+RECIPE_SIZES = (1000, 10000, 50000)
+ITEM_QUERIES = ["iron", "iron ingot", "dimond", "create:brass casing", "xyzzy"]
+RECIPE_QUERIES = ["iron", "gold block", "type:blasting", "uses:minecraft:coal_ore", "type:shaped mod:create steel"]
+SCOPED_QUERIES = ["mod:create", "create:iron", "mod:ae2 gold plate", "#forge:ingots", "#forge:ingots mod:thermal"]
+TYPED_QUERY = "iron ingot"
+GENERATE_COUNT = 1000
+EDIT_COUNT = 10
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+TOLERANCE = 0.25
+NOISE_MS = 1.0
+
+
+class Case:
+    def __init__(self, name, setup, run, units, unit):
+        self.name = name
+        self.setup = setup
+        self.run = run
+        self.units = units
+        self.unit = unit
+
+
+def item_cases(directory, sizes):
+    for size in sizes:
+        file_path = write_items(directory, size)
+
+        def load_items(file_path=file_path):
+            return ItemFile(file_path)
+
+        def built_index(file_path=file_path):
+            return ItemSearchIndex(ItemFile(file_path))
+
+        def tagged_index(file_path=file_path):
+            items = ItemFile(file_path)
+            tags = {"#forge:ingots": {item for item in items if "_ingot" in item}}
+            return ItemSearchIndex(items, tags=tags)
+
+        def search_all(index, queries=ITEM_QUERIES):
+            for query in queries:
+                index.search(query)
+
+        def type_ahead(index):
+            session = SearchSession(index)
+            for end in range(1, len(TYPED_QUERY) + 1):
+                session.search(TYPED_QUERY[:end])
+
+        yield Case(f"items.index[{size}]", load_items, ItemSearchIndex, size, "items")
+        yield Case(f"items.search[{size}]", built_index, search_all, len(ITEM_QUERIES), "queries")
+        yield Case(f"items.scoped_search[{size}]", tagged_index, lambda index: search_all(index, SCOPED_QUERIES),
+                   len(SCOPED_QUERIES), "queries")
+        yield Case(f"items.type_ahead[{size}]", built_index, type_ahead, len(TYPED_QUERY), "keys")
+
+
+def recipe_cases(directory, sizes):
+    yield Case(f"recipes.generate[{GENERATE_COUNT}]", lambda: list(recipes(GENERATE_COUNT)),
+               lambda generated: [render_recipe(recipe) for recipe in generated], GENERATE_COUNT, "recipes")
+
+    for size in sizes:
+        file_path = write_script(directory, size)
+
+        def load(file_path=file_path):
+            store = RecipeStore()
+            store.load(read_script(file_path))
+            return store
+
+        def search_all(store):
+            for query in RECIPE_QUERIES:
+                filters, text = parse_query(query)
+                found = store.query(filters) if filters else store.ordered()
+                if text:
+                    search_recipes(text, found)
+
+        def rewrite(store, file_path=file_path):
+            save_full(store, file_path + ".full.js", True, store.ordered())
+
+        def copy_and_load(file_path=file_path):
+            target = file_path + ".incremental.js"
+            shutil.copyfile(file_path, target)
+            store = RecipeStore()
+            store.load(read_script(target))
+            store.target = target
+            store.edits = [recipe for recipe in store.cooking()[:EDIT_COUNT]]
+            return store
+
+        def save_incremental(store):
+            xp = round(time.perf_counter() % 1, 3)
+            store.modify(store.edits, SetXp(xp))
+            save_script(store, store.target)
+
+        yield Case(f"recipes.load[{size}]", lambda: None, lambda _, load=load: load(), size, "recipes")
+        yield Case(f"recipes.search[{size}]", load, search_all, len(RECIPE_QUERIES), "queries")
+        yield Case(f"recipes.save_full[{size}]", load, rewrite, size, "recipes")
+        yield Case(f"recipes.save_incremental[{size}]", copy_and_load, save_incremental, EDIT_COUNT, "edits")
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def measure(case, repeat):
+    state = case.setup()
+    case.run(state)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        case.run(state)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    case.run(state)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    p50 = percentile(samples, 0.5)
+    return {
+        "p50_ms": round(p50, 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+        "throughput": round(case.units / (p50 / 1000), 1) if p50 > 0 else None,
+        "unit": case.unit,
+        "peak_mb": round(peak / (1 << 20), 2),
+    }
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        limit = previous["p50_ms"] * (1 + tolerance)
+        if result["p50_ms"] > limit and result["p50_ms"] - previous["p50_ms"] > NOISE_MS:
+            regressions.append((name, previous["p50_ms"], result["p50_ms"]))
+    return regressions
+
+
+def print_row(name, result, previous, out):
+    change = ""
+    if previous is not None and previous["p50_ms"] > 0:
+        change = f"{(result['p50_ms'] / previous['p50_ms'] - 1) * 100:+.0f}%"
+    throughput = f"{result['throughput']:,.0f} {result['unit']}/s" if result["throughput"] else "-"
+    print(f"{name:<36}{result['p50_ms']:>10.2f}{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+          f"{throughput:>22}{result['peak_mb']:>10.1f}{change:>8}", file=out)
+
+
+def main(argv=None, out=sys.stdout):
+    parser = argparse.ArgumentParser(description="Benchmark search, parse, generate and save paths.")
+    parser.add_argument("-r", "--repeat", type=int, default=7, help="timed runs per case (default: 7)")
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--quick", action="store_true", help="only use the smallest fixture sizes")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="write these results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed p50 slowdown before failing (default: 0.25)")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    item_sizes = ITEM_SIZES[:1] if args.quick else ITEM_SIZES
+    recipe_sizes = RECIPE_SIZES[:1] if args.quick else RECIPE_SIZES
+    directory = tempfile.mkdtemp(prefix="kubejs-bench-")
+    cwd = os.getcwd()
+    os.chdir(directory)
+    results = {}
+    try:
+        print(f"fuzzy backend: {get_matcher().name}, {args.repeat} runs per case", file=out)
+        print(f"{'case':<36}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'throughput':>22}{'peak MB':>10}{'vs base':>8}",
+              file=out)
+        for case in list(item_cases(directory, item_sizes)) + list(recipe_cases(directory, recipe_sizes)):
+            if args.filter not in case.name:
+                continue
+            results[case.name] = measure(case, args.repeat)
+            print_row(case.name, results[case.name], baseline.get(case.name), out)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"baseline written to {args.baseline}", file=out)
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, before, after in regressions:
+        print(f"REGRESSION {name}: p50 {before:.2f} ms -> {after:.2f} ms", file=out)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
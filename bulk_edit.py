@@ -0,0 +1,67 @@
+from recipe_index import parse_query
+from recipe_model import intern_id
+
+
+class ReplaceItem:
+    label = "Replace input item"
+
+    def __init__(self, old_item, new_item):
+        self.old_item = old_item
+        self.new_item = intern_id(new_item)
+
+    def filters(self):
+        return [("uses", self.old_item.lower())]
+
+    def __call__(self, recipe):
+        if self.old_item not in recipe.inputs:
+            return False
+        recipe.inputs = tuple(self.new_item if item == self.old_item else item for item in recipe.inputs)
+        if recipe.key is not None:
+            recipe.key = tuple((k, self.new_item if v == self.old_item else v) for k, v in recipe.key)
+        return True
+
+
+class ScaleTime:
+    label = "Scale cooking time"
+
+    def __init__(self, factor):
+        self.factor = factor
+
+    def filters(self):
+        return [("type", "cooking")]
+
+    def __call__(self, recipe):
+        default_time = recipe.type.default_time
+        if recipe.time is None and default_time is None:
+            return False
+        time = recipe.time if recipe.time is not None else default_time
+        time = max(1, round(time * self.factor))
+        if time == recipe.time:
+            return False
+        recipe.time = time
+        return True
+
+
+class SetXp:
+    label = "Set cooking xp"
+
+    def __init__(self, xp):
+        self.xp = xp
+
+    def filters(self):
+        return [("type", "cooking")]
+
+    def __call__(self, recipe):
+        if not recipe.type.has("xp") or recipe.xp == self.xp:
+            return False
+        recipe.xp = self.xp
+        return True
+
+
+def select(store, edit, query=""):
+    filters, _ = parse_query(query)
+    return store.query(edit.filters() + filters)
+
+
+def apply_edit(store, edit, query=""):
+    return store.modify(select(store, edit, query), edit)
@@ -0,0 +1,90 @@
+from PyQt6.QtWidgets import (
+    QComboBox, QDialog, QDialogButtonBox, QDoubleSpinBox, QFormLayout, QLabel, QLineEdit, QStackedWidget,
+    QVBoxLayout, QWidget
+)
+from bulk_edit import ReplaceItem, ScaleTime, SetXp, select
+
+
+class BulkEditDialog(QDialog):
+    def __init__(self, store, query="", parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.setWindowTitle("Bulk Edit")
+        layout = QVBoxLayout()
+        form = QFormLayout()
+
+        self.query_input = QLineEdit(query)
+        self.query_input.setPlaceholderText("Limit to recipes matching, e.g. 'type:smelting mod:create'")
+        self.query_input.textChanged.connect(self.update_preview)
+        form.addRow("Recipes:", self.query_input)
+
+        self.operation = QComboBox()
+        self.operation.addItems([ReplaceItem.label, ScaleTime.label, SetXp.label])
+        form.addRow("Operation:", self.operation)
+        layout.addLayout(form)
+
+        self.pages = QStackedWidget()
+        replace_page = QWidget()
+        replace_form = QFormLayout()
+        self.old_item_input = QLineEdit()
+        self.old_item_input.setPlaceholderText("minecraft:iron_ingot")
+        self.old_item_input.textChanged.connect(self.update_preview)
+        replace_form.addRow("Replace:", self.old_item_input)
+        self.new_item_input = QLineEdit()
+        self.new_item_input.setPlaceholderText("#forge:ingots/iron")
+        replace_form.addRow("With:", self.new_item_input)
+        replace_page.setLayout(replace_form)
+        self.pages.addWidget(replace_page)
+
+        scale_page = QWidget()
+        scale_form = QFormLayout()
+        self.factor_input = QDoubleSpinBox()
+        self.factor_input.setRange(0.01, 100.0)
+        self.factor_input.setSingleStep(0.1)
+        self.factor_input.setValue(1.0)
+        scale_form.addRow("Multiply time by:", self.factor_input)
+        scale_page.setLayout(scale_form)
+        self.pages.addWidget(scale_page)
+
+        xp_page = QWidget()
+        xp_form = QFormLayout()
+        self.xp_input = QDoubleSpinBox()
+        self.xp_input.setRange(0.0, 1000.0)
+        self.xp_input.setSingleStep(0.1)
+        xp_form.addRow("XP:", self.xp_input)
+        xp_page.setLayout(xp_form)
+        self.pages.addWidget(xp_page)
+
+        self.operation.currentIndexChanged.connect(self.pages.setCurrentIndex)
+        self.operation.currentIndexChanged.connect(self.update_preview)
+        layout.addWidget(self.pages)
+
+        self.preview_label = QLabel()
+        layout.addWidget(self.preview_label)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.setLayout(layout)
+        self.update_preview()
+
+    def edit(self):
+        index = self.operation.currentIndex()
+        if index == 0:
+            old_item = self.old_item_input.text().strip()
+            new_item = self.new_item_input.text().strip()
+            return ReplaceItem(old_item, new_item) if old_item and new_item else None
+        if index == 1:
+            return ScaleTime(self.factor_input.value())
+        return SetXp(round(self.xp_input.value(), 2))
+
+    def update_preview(self):
+        index = self.operation.currentIndex()
+        if index == 0:
+            old_item = self.old_item_input.text().strip()
+            edit = ReplaceItem(old_item, old_item) if old_item else None
+        else:
+            edit = self.edit()
+        count = len(select(self.store, edit, self.query_input.text())) if edit is not None else 0
+        self.preview_label.setText(f"{count} recipes selected")
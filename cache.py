@@ -0,0 +1,93 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from recipe_parser import read_script
+from utils import file_signature
+
+CACHE_DIR = ".cache"
+CACHE_VERSION = 6
+HASH_CHUNK = 1 << 20
+
+
+def content_hash(file_path):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileCache:
+    def __init__(self, file_path, kind, cache_dir=CACHE_DIR):
+        self.file_path = os.path.abspath(file_path)
+        name = hashlib.blake2b(f"{kind}:{self.file_path}".encode('utf-8'), digest_size=16).hexdigest()
+        self.cache_dir = cache_dir
+        self.cache_path = os.path.join(cache_dir, f"{name}.{kind}")
+        self.hash = None
+
+    def source_hash(self):
+        if self.hash is None:
+            self.hash = content_hash(self.file_path)
+        return self.hash
+
+    def is_valid(self, header):
+        if header.get("version") != CACHE_VERSION or header.get("path") != self.file_path:
+            return False
+        size, mtime_ns = file_signature(self.file_path)
+        if header.get("size") != size:
+            return False
+        return header.get("mtime_ns") == mtime_ns or header.get("hash") == self.source_hash()
+
+    def load(self):
+        try:
+            with open(self.cache_path, 'rb') as f:
+                header = pickle.load(f)
+                if not isinstance(header, dict) or not self.is_valid(header):
+                    return None
+                return pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return None
+
+    def save(self, payload):
+        size, mtime_ns = file_signature(self.file_path)
+        header = {
+            "version": CACHE_VERSION,
+            "path": self.file_path,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "hash": self.source_hash(),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.cache_path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+        except OSError:
+            pass
+
+
+def stamp_source(source, file_path):
+    source.file_path = file_path
+    source.signature = file_signature(file_path)
+    return source
+
+
+def cached_script(file_path):
+    source = FileCache(file_path, "recipes").load()
+    return stamp_source(source, file_path) if source is not None else None
+
+
+def cached_read_script(file_path):
+    cache = FileCache(file_path, "recipes")
+    source = cache.load()
+    if source is None:
+        source = read_script(file_path)
+        cache.save(source)
+    return stamp_source(source, file_path)
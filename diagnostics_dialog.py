@@ -0,0 +1,88 @@
+from PyQt6.QtWidgets import (
+    QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel, QPushButton, QTableWidget,
+    QTableWidgetItem, QVBoxLayout
+)
+from profiler import profiler
+
+COLUMNS = ["Span", "Calls", "Total ms", "Mean ms", "p95 ms", "Max ms"]
+
+
+class DiagnosticsDialog(QDialog):
+    def __init__(self, stall_detector, parent=None):
+        super().__init__(parent)
+        self.stall_detector = stall_detector
+        self.setWindowTitle("Diagnostics")
+        self.resize(640, 400)
+        layout = QVBoxLayout()
+
+        self.record_box = QCheckBox("Record timings and event loop stalls")
+        self.record_box.setChecked(profiler.enabled)
+        self.record_box.toggled.connect(self.set_recording)
+        layout.addWidget(self.record_box)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel()
+        layout.addWidget(self.status_label)
+
+        buttons = QHBoxLayout()
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        buttons.addWidget(refresh_button)
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self.clear)
+        buttons.addWidget(clear_button)
+        export_button = QPushButton("Export Trace...")
+        export_button.clicked.connect(self.export)
+        buttons.addWidget(export_button)
+        buttons.addStretch()
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+        buttons.addWidget(close_button)
+        layout.addLayout(buttons)
+        self.setLayout(layout)
+        self.refresh()
+
+    def set_recording(self, enabled):
+        profiler.enabled = enabled
+        if enabled:
+            self.stall_detector.start()
+        else:
+            self.stall_detector.stop()
+        self.refresh()
+
+    def refresh(self):
+        rows = profiler.summary()
+        self.table.setRowCount(len(rows))
+        for row, (category, name, calls, total, mean, p95, longest) in enumerate(rows):
+            values = [f"{category}: {name}", str(calls)] + [f"{value:.1f}" for value in (total, mean, p95, longest)]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+        stalls = [row for row in rows if row[0] == "stall"]
+        if not profiler.enabled:
+            self.status_label.setText("Recording is off")
+        elif stalls:
+            self.status_label.setText(f"{stalls[0][2]} event loop stalls, longest {stalls[0][6]:.0f} ms")
+        else:
+            self.status_label.setText(f"{len(profiler.events)} spans recorded, no event loop stalls")
+
+    def clear(self):
+        profiler.clear()
+        self.refresh()
+
+    def export(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "kubejs-trace.json",
+                                                   "Chrome Trace (*.json);;All Files (*)")
+        if not file_path:
+            return
+        try:
+            profiler.export(file_path)
+        except OSError as e:
+            self.status_label.setText(f"Could not export trace: {e}")
+            return
+        self.status_label.setText(f"Trace written to {file_path} (open it in chrome://tracing or Perfetto)")
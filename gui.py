@@ -1,20 +1,68 @@
 import os
 import json
+from importlib import import_module
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QListWidget, QLineEdit,
-    QFileDialog, QPushButton, QHBoxLayout, QTextEdit, QTabWidget, QListWidgetItem, QSplitter
+    QWidget, QVBoxLayout, QLabel, QListView, QLineEdit, QProgressBar,
+    QFileDialog, QPushButton, QHBoxLayout, QTextEdit, QTabWidget, QSplitter
 )
 from PyQt6.QtCore import Qt
-from fuzzywuzzy import fuzz
-from tabs.crafting_table_tab import CraftingTableTab
-from tabs.smelting_cooking_tab import SmeltingCookingTab
+from PyQt6.QtGui import QKeySequence, QShortcut
+from bulk_edit import apply_edit
+from cache import FileCache, cached_read_script
+from item_model import ItemFile, ItemFilterProxy, ItemListModel
+from item_registry import expand_filters, read_tags, tags_path
+from matcher import get_matcher
+from profiler import StallDetector, profiler
+from recipe_generator import render_recipe
+from recipe_index import parse_query, search_recipes
+from recipe_list_model import RecipeListModel
+from recipe_model import RecipeStore
+from recipe_parser import parse_recipe_text
+from script_sync import sync_script
+from script_watcher import ScriptWatcher, read_bytes
+from script_writer import save_script, save_workspace
+from search_index import ItemSearchIndex, SearchSession
+from search_worker import SearchWorker
+from startup import StartupLoader
+from utils import file_signature
+from workspace import in_workspace, load_workspace
+
+TABS = [
+    ("crafting_tab", "tabs.crafting_table_tab", "CraftingTableTab", "Crafting Table"),
+    ("smelting_tab", "tabs.smelting_cooking_tab", "SmeltingCookingTab", "Smelting/Cooking"),
+    ("processing_tab", "tabs.processing_tab", "ProcessingTab", "Processing"),
+]
 
 class CraftingGUI(QWidget):
     def __init__(self):
         super().__init__()
-        self.item_list = QListWidget()
+        self.item_model = ItemListModel(parent=self)
+        self.item_filter = ItemFilterProxy(self.item_model, self)
+        self.item_list = QListView()
+        self.item_list.setModel(self.item_filter)
+        self.item_list.setUniformItemSizes(True)
+        self.item_index = ItemSearchIndex()
+        self.item_session = SearchSession(self.item_index)
+        self.recipe_store = RecipeStore()
+        self.recipe_list_model = RecipeListModel(self)
+        self.script_watcher = ScriptWatcher(self)
+        self.script_watcher.changed.connect(self.script_changed)
+        self.stall_detector = StallDetector(self)
+        if profiler.enabled:
+            self.stall_detector.start()
+        self.diagnostics_dialog = None
+        self.item_search = SearchWorker(self.item_search_job, self)
+        self.item_search.setObjectName("item search")
+        self.item_search.results_ready.connect(self.show_item_results)
+        self.recipe_search = SearchWorker(self.recipe_search_job, self)
+        self.recipe_search.setObjectName("recipe search")
+        self.recipe_search.results_ready.connect(self.show_recipe_results)
         self.append_file_path = None
         self.item_file_path = None
+        self.workspace_path = None
+        self.crafting_tab = None
+        self.smelting_tab = None
+        self.processing_tab = None
         self.load_config()
         self.init_ui()
 
@@ -29,7 +77,7 @@ class CraftingGUI(QWidget):
 
         search_layout = QHBoxLayout()
         self.search_bar = QLineEdit()
-        self.search_bar.setPlaceholderText("Search Items (e.g., 'stone', 'minecraft stone')...")
+        self.search_bar.setPlaceholderText("Search Items (e.g., 'stone', 'minecraft stone', 'mod:create', '#forge:ingots')...")
         self.search_bar.textChanged.connect(self.filter_items)
         search_layout.addWidget(self.search_bar)
 
@@ -38,16 +86,20 @@ class CraftingGUI(QWidget):
         search_layout.addWidget(self.load_button)
         left_layout.addLayout(search_layout)
 
-        self.item_list.itemClicked.connect(self.select_item)
+        self.load_progress = QProgressBar()
+        self.load_progress.setTextVisible(True)
+        self.load_progress.hide()
+        left_layout.addWidget(self.load_progress)
+
+        self.item_list.clicked.connect(self.select_item)
         self.item_list.setMinimumHeight(250)
         left_layout.addWidget(self.item_list)
 
         self.tabs = QTabWidget()
-        self.crafting_tab = CraftingTableTab(self.item_list, self)
-        self.smelting_tab = SmeltingCookingTab(self.item_list, self)
-
-        self.tabs.addTab(self.crafting_tab, "Crafting Table")
-        self.tabs.addTab(self.smelting_tab, "Smelting/Cooking")
+        for _, _, _, title in TABS:
+            self.tabs.addTab(QWidget(), title)
+        self.ensure_tab(0)
+        self.tabs.currentChanged.connect(self.ensure_tab)
         left_layout.addWidget(self.tabs)
 
         left_widget.setLayout(left_layout)
@@ -65,13 +117,18 @@ class CraftingGUI(QWidget):
 
         recipes_search_layout = QHBoxLayout()
         self.recipes_search_bar = QLineEdit()
-        self.recipes_search_bar.setPlaceholderText("Search Recipes (e.g., 'stone')...")
+        self.recipes_search_bar.setPlaceholderText("Search Recipes (e.g., 'stone', 'uses:minecraft:coal', 'type:blasting', 'type:create')...")
         self.recipes_search_bar.textChanged.connect(self.filter_recipes)
         recipes_search_layout.addWidget(self.recipes_search_bar)
+        self.workspace_button = QPushButton("Open Workspace...")
+        self.workspace_button.clicked.connect(self.open_workspace)
+        recipes_search_layout.addWidget(self.workspace_button)
         existing_recipes_layout.addLayout(recipes_search_layout)
 
-        self.recipes_list = QListWidget()
-        self.recipes_list.itemClicked.connect(self.display_selected_recipe)
+        self.recipes_list = QListView()
+        self.recipes_list.setModel(self.recipe_list_model)
+        self.recipes_list.setUniformItemSizes(True)
+        self.recipes_list.clicked.connect(self.display_selected_recipe)
         existing_recipes_layout.addWidget(self.recipes_list)
 
         delete_append_layout = QHBoxLayout()
@@ -82,6 +139,10 @@ class CraftingGUI(QWidget):
         self.append_button = QPushButton("Add")
         self.append_button.clicked.connect(self.append_to_file)
         delete_append_layout.addWidget(self.append_button)
+
+        self.bulk_edit_button = QPushButton("Bulk Edit...")
+        self.bulk_edit_button.clicked.connect(self.open_bulk_edit)
+        delete_append_layout.addWidget(self.bulk_edit_button)
         existing_recipes_layout.addLayout(delete_append_layout)
 
         existing_recipes_widget.setLayout(existing_recipes_layout)
@@ -110,16 +171,77 @@ class CraftingGUI(QWidget):
         main_layout.addWidget(main_splitter)
         self.setLayout(main_layout)
 
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self).activated.connect(self.open_diagnostics)
+
+    def ensure_tab(self, index):
+        attribute, module_name, class_name, title = TABS[index]
+        if getattr(self, attribute) is not None:
+            return getattr(self, attribute)
+        tab = getattr(import_module(module_name), class_name)(self.item_list, self)
+        setattr(self, attribute, tab)
+        self.tabs.blockSignals(True)
+        current = self.tabs.currentIndex()
+        placeholder = self.tabs.widget(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, tab, title)
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+        return tab
+
+    def set_append_path_inputs(self, text, source=None):
+        for attribute, _, _, _ in TABS:
+            tab = getattr(self, attribute)
+            if tab is not None and tab is not source and tab.append_path_input.text() != text:
+                tab.append_path_input.setText(text)
+
+    def start_background_load(self, timer=None):
+        loader = StartupLoader(self)
+        loaded = []
         if self.item_file_path and os.path.exists(self.item_file_path):
-            self.load_items_from_file(auto_load=True)
-        if self.append_file_path and os.path.exists(self.append_file_path):
-            self.load_recipes()
+            file_path = self.item_file_path
+
+            def read_items():
+                loaded.append(self.read_items(file_path))
+                return loaded[-1]
+
+            loader.add_step("Loading items", read_items, lambda result: self.apply_items(file_path, result))
+        if self.workspace_path and os.path.isdir(self.workspace_path):
+            root = self.workspace_path
+            loader.add_step("Loading workspace", lambda: load_workspace(root),
+                            lambda sources: self.apply_workspace(root, sources))
+        elif self.append_file_path and os.path.exists(self.append_file_path):
+            recipes_path = self.append_file_path
+            loader.add_step("Loading recipes", lambda: cached_read_script(recipes_path), self.apply_recipes)
+        loader.add_step("Preparing search", lambda: self.prepare_search(loaded))
+        loader.progress.connect(self.show_load_progress)
+        loader.failed.connect(lambda label, message: self.result_label.setText(f"{label} failed: {message}"))
+        if timer is not None:
+            loader.step_done.connect(lambda i, _: timer.mark(loader.steps[i][0]))
+        self.startup_loader = loader
+        loader.start()
+        return loader
+
+    def show_load_progress(self, step, total, label):
+        if step >= total:
+            self.load_progress.hide()
+            return
+        self.load_progress.setRange(0, total)
+        self.load_progress.setValue(step)
+        self.load_progress.setFormat(f"{label}...")
+        self.load_progress.show()
+
+    def prepare_search(self, loaded):
+        get_matcher()
+        for _, index in loaded:
+            index.ensure_built()
 
-    def display_selected_recipe(self, item):
+    def display_selected_recipe(self, index):
 
-        if item:
-            recipe_text = item.data(Qt.ItemDataRole.UserRole)
-            self.result_display.setText(recipe_text)
+        if index.isValid():
+            recipe = self.recipe_store.get(index.data(Qt.ItemDataRole.UserRole))
+            if recipe is not None:
+                self.result_display.setText(render_recipe(recipe))
 
     def load_items_from_file(self, auto_load=False):
         if not auto_load:
@@ -131,85 +253,81 @@ class CraftingGUI(QWidget):
             file_path = self.item_file_path
 
         if file_path and os.path.exists(file_path):
-            with open(file_path, 'r') as file:
-                items = file.read().splitlines()
-                self.item_list.clear()
-                self.item_list.addItems(items)
-            self.item_file_path = file_path
-            self.save_config()
+            with profiler.span("load_items_from_file", file=os.path.basename(file_path)):
+                self.apply_items(file_path, self.read_items(file_path))
+
+    def read_items(self, file_path):
+        lines_cache = FileCache(file_path, "lines")
+        offsets = lines_cache.load()
+        items = ItemFile(file_path, offsets)
+        if items.offsets is not offsets:
+            lines_cache.save(items.offsets)
+        return items, ItemSearchIndex(items, lazy=True, cache=FileCache(file_path, "index"),
+                                      tags=read_tags(tags_path(file_path)))
+
+    def apply_items(self, file_path, result):
+        items, index = result
+        self.item_search.cancel()
+        if isinstance(self.item_model.items, ItemFile):
+            self.item_model.items.close()
+        self.item_index = index
+        self.item_session = SearchSession(index)
+        self.item_model.set_items(items)
+        self.item_file_path = file_path
+        self.save_config()
 
     def filter_items(self):
-        search_text = self.search_bar.text().strip().lower()
-
-        if not hasattr(self, "all_items"):
-            self.all_items = [self.item_list.item(i).text() for i in range(self.item_list.count())]
-
-        if not search_text:
-            self.item_list.clear()
-            self.item_list.addItems(self.all_items)
-            return
+        with profiler.span("filter_items"):
+            search_text = self.search_bar.text().strip().lower()
 
-        exact_matches = []
-        partial_matches = []
+            if not search_text:
+                self.item_search.cancel()
+                self.item_filter.clear_filter()
+                return
 
-        for item_text in self.all_items:
-            item_lower = item_text.lower().replace("_", " ")
-            if all(term in item_lower for term in search_text.split()):
-                exact_matches.append((item_text, 100))
-            else:
-                fuzzy_score = fuzz.partial_ratio(search_text, item_lower)
-                if fuzzy_score >= 70:
-                    partial_matches.append((item_text, fuzzy_score))
+            self.item_search.schedule(search_text)
 
-        sorted_items = sorted(exact_matches + partial_matches, key=lambda x: x[1], reverse=True)
+    def item_search_job(self, search_text):
+        session = self.item_session
+        return lambda cancelled: session.search(search_text, cancelled)
 
-        self.item_list.clear()
-        self.item_list.addItems([item[0] for item in sorted_items])
+    def show_item_results(self, rows):
+        with profiler.span("show_item_results"):
+            self.item_filter.set_rows(rows)
 
     def filter_recipes(self):
-        search_text = self.recipes_search_bar.text().strip().lower()
-
-        all_recipes = self.crafting_tab.recipes + self.smelting_tab.recipes
+        with profiler.span("filter_recipes"):
+            search_text = self.recipes_search_bar.text().strip().lower()
 
-        if not search_text:
-            self.update_recipes_list()
-            return
-
-        filtered_recipes = []
-        for recipe in all_recipes:
-            output_item = ""
-            if "event.shaped" in recipe or "event.shapeless" in recipe:
-                output_item = self.crafting_tab.extract_output_item(recipe).lower()
-            else:
-                output_item = self.smelting_tab.extract_output_item(recipe).lower()
+            if not search_text:
+                self.recipe_search.cancel()
+                self.update_recipes_list()
+                return
 
-            if all(term in output_item for term in search_text.split()):
-                filtered_recipes.append((recipe, 100))
-            else:
-                fuzzy_score = fuzz.partial_ratio(search_text, output_item)
-                if fuzzy_score >= 70:
-                    filtered_recipes.append((recipe, fuzzy_score))
+            self.recipe_search.schedule(search_text)
 
-        sorted_recipes = sorted(filtered_recipes, key=lambda x: x[1], reverse=True)
+    def recipe_search_job(self, search_text):
+        filters, search_text = parse_query(search_text)
+        filters = expand_filters(filters, self.item_index.registry)
+        all_recipes = self.recipe_store.query(filters) if filters else self.recipe_store.ordered()
+        if not search_text:
+            return lambda cancelled: [(recipe, 100) for recipe in all_recipes]
+        return lambda cancelled: search_recipes(search_text, all_recipes, cancelled)
 
-        self.recipes_list.clear()
-        for recipe, _ in sorted_recipes:
-            if "event.shaped" in recipe or "event.shapeless" in recipe:
-                item = QListWidgetItem(f"[Crafting] {self.crafting_tab.extract_output_item(recipe)}")
-            else:
-                item = QListWidgetItem(f"[Smelting/Cooking] {self.smelting_tab.extract_output_item(recipe)}")
-            item.setData(Qt.ItemDataRole.UserRole, recipe)
-            self.recipes_list.addItem(item)
+    def show_recipe_results(self, sorted_recipes):
+        with profiler.span("show_recipe_results"):
+            self.recipe_list_model.set_recipes(recipe for recipe, _ in sorted_recipes)
 
-    def select_item(self, item):
+    def select_item(self, index):
         current_tab = self.tabs.currentWidget()
-        if current_tab:
-            current_tab.selected_item = item.text()
+        if current_tab and index.isValid():
+            current_tab.selected_item = index.data()
 
     def save_config(self):
         config = {
             "item_file_path": self.item_file_path,
-            "recipes_file_path": self.append_file_path
+            "recipes_file_path": self.append_file_path,
+            "workspace_path": self.workspace_path
         }
         with open("config.json", "w") as f:
             json.dump(config, f)
@@ -220,6 +338,7 @@ class CraftingGUI(QWidget):
                 config = json.load(f)
                 self.item_file_path = config.get("item_file_path")
                 self.append_file_path = config.get("recipes_file_path")
+                self.workspace_path = config.get("workspace_path")
         except FileNotFoundError:
             pass
 
@@ -228,106 +347,195 @@ class CraftingGUI(QWidget):
         if not recipe_text or "Error:" in recipe_text:
             return
 
+        if self.workspace_path:
+            self.check_workspace_target()
         if not self.append_file_path:
-            self.browse_and_load_recipes()
+            if self.workspace_path:
+                self.choose_workspace_target()
+            else:
+                self.browse_and_load_recipes()
             if not self.append_file_path:
                 return
 
-        if "event.shaped" in recipe_text or "event.shapeless" in recipe_text:
-            self.crafting_tab.recipes.append(recipe_text)
-        else:
-            self.smelting_tab.recipes.append(recipe_text)
+        recipe = parse_recipe_text(recipe_text)
+        if recipe is None:
+            self.result_label.setText("Could not parse recipe")
+            return
+
+        if recipe in self.recipe_store:
+            self.result_label.setText("Recipe already exists in memory")
+            return
 
-        self.update_recipes_list()
-        self.result_label.setText("Recipe appended to memory (click Save to write to file)")
+        conflicts = self.recipe_store.conflicts(recipe)
+        recipe.source = self.append_file_path
+        self.recipe_store.add(recipe)
+        if self.recipes_search_bar.text().strip():
+            self.filter_recipes()
+        else:
+            self.recipe_list_model.insert_recipe(recipe)
+        if conflicts:
+            outputs = ", ".join(f"{count}x {output}" for output, count in conflicts)
+            self.result_label.setText(f"Recipe appended, but the same inputs already make {outputs}")
+        else:
+            self.result_label.setText("Recipe appended to memory (click Save to write to file)")
 
     def delete_recipe(self):
-        selected_item = self.recipes_list.currentItem()
-        if not selected_item or not self.append_file_path:
+        selected = self.recipes_list.currentIndex()
+        if not selected.isValid() or not (self.append_file_path or self.workspace_path):
             self.result_label.setText("No recipe selected or file specified")
             return
 
-        recipe_text = selected_item.data(Qt.ItemDataRole.UserRole)
-
-        if recipe_text in self.crafting_tab.recipes:
-            self.crafting_tab.recipes.remove(recipe_text)
-        elif recipe_text in self.smelting_tab.recipes:
-            self.smelting_tab.recipes.remove(recipe_text)
+        self.recipe_store.remove(selected.data(Qt.ItemDataRole.UserRole))
 
-        self.recipes_list.takeItem(self.recipes_list.row(selected_item))
+        self.recipe_list_model.remove_row(selected.row())
         self.result_label.setText("Recipe removed from memory (click Save to update file)")
 
-    def save_recipes(self):
-        if not self.append_file_path:
-            self.result_label.setText("No file specified to save")
-            return
+    def open_bulk_edit(self):
+        from bulk_edit_dialog import BulkEditDialog
 
-        file_path = self.append_file_path
-        is_js = file_path.endswith('.js')
-        header = "ServerEvents.recipes(event => {\n" if is_js else "// Recipes\n"
-        footer = "})\n" if is_js else ""
+        filters, _ = parse_query(self.recipes_search_bar.text())
+        dialog = BulkEditDialog(self.recipe_store, " ".join(f"{field}:{value}" for field, value in filters), self)
+        if not dialog.exec():
+            return
+        edit = dialog.edit()
+        if edit is None:
+            return
+        changed = apply_edit(self.recipe_store, edit, dialog.query_input.text())
+        if self.recipes_search_bar.text().strip():
+            self.filter_recipes()
+        else:
+            self.recipe_list_model.refresh()
+        self.result_label.setText(f"Updated {len(changed)} recipes in memory (click Save to write to file)")
 
-        all_recipes = self.crafting_tab.recipes + self.smelting_tab.recipes
+    def open_diagnostics(self):
+        from diagnostics_dialog import DiagnosticsDialog
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(header + "\n")
-            for i, recipe in enumerate(all_recipes):
-                if i > 0:
-                    f.write("\n\n\n\n\n")
-                f.write(f"  {recipe}\n")
-            if is_js:
-                f.write(footer)
+        if self.diagnostics_dialog is None:
+            self.diagnostics_dialog = DiagnosticsDialog(self.stall_detector, self)
+        self.diagnostics_dialog.refresh()
+        self.diagnostics_dialog.show()
+        self.diagnostics_dialog.raise_()
 
-        self.result_label.setText(f"Recipes saved to {file_path}")
+    def save_recipes(self):
+        with profiler.span("save_recipes"):
+            self.script_watcher.flush()
+            if self.workspace_path:
+                try:
+                    saved = save_workspace(self.recipe_store)
+                except (OSError, UnicodeDecodeError) as e:
+                    self.result_label.setText(f"Could not save recipes: {e}")
+                    return
+                self.script_watcher.refresh(saved)
+                self.result_label.setText(f"Saved {len(saved)} changed scripts in {self.workspace_path}")
+                return
 
-    def load_recipes(self):
-        if not self.append_file_path or not os.path.exists(self.append_file_path):
-            self.result_label.setText("No valid recipes file selected")
-            return
+            if not self.append_file_path:
+                self.result_label.setText("No file specified to save")
+                return
 
-        self.crafting_tab.recipes = []
-        self.smelting_tab.recipes = []
+            file_path = self.append_file_path
+            try:
+                save_script(self.recipe_store, file_path)
+            except (OSError, UnicodeDecodeError) as e:
+                self.result_label.setText(f"Could not save recipes: {e}")
+                return
 
-        file_path = self.append_file_path
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            self.script_watcher.refresh([file_path])
+            self.result_label.setText(f"Recipes saved to {file_path}")
 
-        current_recipe = []
-        in_recipe = False
+    def load_recipes(self):
+        with profiler.span("load_recipes"):
+            if not self.append_file_path or not os.path.exists(self.append_file_path):
+                self.result_label.setText("No valid recipes file selected")
+                return
 
-        for line in content.splitlines():
-            stripped_line = line.strip()
+            self.workspace_path = None
+            self.recipe_list_model.source_root = None
+            self.save_config()
+            self.apply_recipes(cached_read_script(self.append_file_path))
 
-            if any(stripped_line.startswith(f"event.{t}(") for t in
-                   ["shaped", "shapeless", "smelting", "blasting", "smoking", "campfireCooking"]):
-                in_recipe = True
-                current_recipe = [line]
-            elif in_recipe:
-                current_recipe.append(line)
-                if stripped_line == ")":
-                    in_recipe = False
-                    recipe_text = "\n".join(current_recipe)
+    def open_workspace(self):
+        root = QFileDialog.getExistingDirectory(self, "Select kubejs/server_scripts Folder", self.workspace_path or "")
+        if not root:
+            return
+        self.workspace_path = root
+        self.save_config()
+        loader = StartupLoader(self)
+        loader.add_step("Loading workspace", lambda: load_workspace(root),
+                        lambda sources: self.apply_workspace(root, sources))
+        loader.progress.connect(self.show_load_progress)
+        loader.failed.connect(lambda label, message: self.result_label.setText(f"{label} failed: {message}"))
+        self.workspace_loader = loader
+        loader.start()
+
+    def apply_workspace(self, root, sources):
+        if root != self.workspace_path:
+            return
+        self.recipe_store.load_many(sources)
+        self.recipe_list_model.source_root = root
+        self.check_workspace_target()
+        self.script_watcher.watch(self.recipe_store.sources)
+        self.filter_recipes()
+        duplicates, conflicts = self.recipe_store.collisions()
+        self.result_label.setText(
+            f"Loaded {len(self.recipe_store)} recipes from {len(sources)} scripts: {duplicates} duplicates, "
+            f"{len(conflicts)} input conflicts")
+
+    def choose_workspace_target(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Script For New Recipes", self.workspace_path,
+            "JavaScript Files (*.js);;All Files (*)"
+        )
+        if file_path and not in_workspace(self.workspace_path, file_path):
+            self.result_label.setText("New recipes must go to a script inside the workspace")
+        elif file_path:
+            self.append_file_path = file_path
+            self.set_append_path_inputs(file_path)
+            self.save_config()
 
-                    if "event.shaped" in recipe_text or "event.shapeless" in recipe_text:
-                        self.crafting_tab.recipes.append(recipe_text)
-                    else:
-                        self.smelting_tab.recipes.append(recipe_text)
+    def check_workspace_target(self):
+        if self.append_file_path and not in_workspace(self.workspace_path, self.append_file_path):
+            self.append_file_path = None
+            self.set_append_path_inputs("")
+            self.save_config()
 
-        self.update_recipes_list()
+    def apply_recipes(self, source):
+        if self.workspace_path or source.file_path != self.append_file_path:
+            return
+        self.recipe_store.load(source)
+        self.script_watcher.watch(self.recipe_store.sources)
+        self.filter_recipes()
+        duplicates, conflicts = self.recipe_store.collisions()
+        if duplicates or conflicts:
+            self.result_label.setText(
+                f"Loaded {len(self.recipe_store)} recipes: {duplicates} duplicates, "
+                f"{len(conflicts)} input conflicts")
+
+    def script_changed(self, file_path):
+        state = self.recipe_store.sources.get(file_path)
+        content = read_bytes(file_path)
+        if state is None or content is None:
+            return
+        old_content = self.script_watcher.snapshots.get(file_path)
+        self.script_watcher.snapshots[file_path] = content
+        if file_signature(file_path) == state.signature:
+            return
+        try:
+            with profiler.span("sync_script", file=os.path.basename(file_path)):
+                report = sync_script(self.recipe_store, file_path, old_content, content)
+        except UnicodeDecodeError:
+            self.result_label.setText(f"{os.path.basename(file_path)} changed on disk but is not valid UTF-8")
+            return
+        self.filter_recipes()
+        message = (f"{os.path.basename(file_path)} changed on disk: {len(report.added)} recipes reloaded, "
+                   f"{len(report.removed)} dropped")
+        if report.conflicts:
+            message += f". {len(report.conflicts)} conflicts with unsaved edits: " + "; ".join(report.conflicts[:3])
+        self.result_label.setText(message)
 
     def update_recipes_list(self):
-        self.recipes_list.clear()
-
-
-        for recipe in self.crafting_tab.recipes:
-            item = QListWidgetItem(f"[Crafting Table] {self.crafting_tab.extract_output_item(recipe)}")
-            item.setData(Qt.ItemDataRole.UserRole, recipe)
-            self.recipes_list.addItem(item)
-
-        for recipe in self.smelting_tab.recipes:
-            item = QListWidgetItem(f"[Smelting/Cooking] {self.smelting_tab.extract_output_item(recipe)}")
-            item.setData(Qt.ItemDataRole.UserRole, recipe)
-            self.recipes_list.addItem(item)
+        with profiler.span("update_recipes_list"):
+            self.recipe_list_model.set_recipes(self.recipe_store.ordered())
 
     def browse_and_load_recipes(self):
         file_path, _ = QFileDialog.getOpenFileName(
@@ -336,7 +544,6 @@ class CraftingGUI(QWidget):
         )
         if file_path:
             self.append_file_path = file_path
-            self.crafting_tab.append_path_input.setText(file_path)
-            self.smelting_tab.append_path_input.setText(file_path)
+            self.set_append_path_inputs(file_path)
             self.load_recipes()
             self.save_config()
\ No newline at end of file
@@ -0,0 +1,116 @@
+from array import array
+from itertools import accumulate, islice, repeat
+from operator import add
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+CHUNK_SIZE = 1 << 20
+CHUNK_LINES = 1 << 15
+
+
+class ItemFile:
+    def __init__(self, file_path, offsets=None):
+        with open(file_path, 'rb') as f:
+            self.data = f.read()
+        self.size = len(self.data)
+        self.end = self.size - 1 if self.data.endswith(b"\n") else self.size
+        self.offsets = offsets if offsets is not None and self.valid_offsets(offsets) else self.line_offsets()
+
+    def valid_offsets(self, offsets):
+        if not offsets:
+            return self.size == 0
+        last = offsets[-1]
+        return offsets[0] == 0 and last < self.size and (last == 0 or self.data[last - 1:last] == b"\n") \
+            and len(offsets) == self.data.count(b"\n", 0, self.end) + 1
+
+    def close(self):
+        self.data = b""
+
+    def line_offsets(self):
+        data = self.data
+        offsets = array('Q', [0])
+        position = 0
+        while position < self.size:
+            end = data.find(b"\n", min(position + CHUNK_SIZE, self.size) - 1)
+            end = self.size if end < 0 else end + 1
+            lengths = map(len, data[position:end].split(b"\n")[:-1])
+            offsets.extend(islice(accumulate(map(add, lengths, repeat(1)), initial=position), 1, None))
+            position = end
+        if offsets[-1] == self.size:
+            offsets.pop()
+        return offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def line_end(self, i):
+        return self.offsets[i + 1] - 1 if i + 1 < len(self.offsets) else self.end
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        line = self.data[self.offsets[i]:self.line_end(i)]
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        return line.decode('utf-8', errors='replace')
+
+    def __iter__(self):
+        count = len(self)
+        start = 0
+        while start < count:
+            stop = min(start + CHUNK_LINES, count)
+            block = self.data[self.offsets[start]:self.line_end(stop - 1)].decode('utf-8', errors='replace')
+            for line in block.split("\n"):
+                yield line[:-1] if line.endswith("\r") else line
+            start = stop
+
+
+class ItemListModel(QAbstractListModel):
+    def __init__(self, items=None, parent=None):
+        super().__init__(parent)
+        self.items = items if items is not None else ()
+
+    def set_items(self, items):
+        self.beginResetModel()
+        self.items = items
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.items[index.row()]
+
+
+class ItemFilterProxy(QAbstractListModel):
+    def __init__(self, source, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.rows = None
+        source.modelReset.connect(self.clear_filter)
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows if isinstance(rows, array) else array('I', rows)
+        self.endResetModel()
+
+    def clear_filter(self):
+        self.beginResetModel()
+        self.rows = None
+        self.endResetModel()
+
+    def source_row(self, row):
+        return row if self.rows is None else self.rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self.source.rowCount() if self.rows is None else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self.source.items[self.source_row(index.row())]
@@ -0,0 +1,132 @@
+import os
+import re
+import threading
+from array import array
+from bisect import bisect_left
+from sys import intern
+
+DEFAULT_NAMESPACE = "minecraft"
+MOD_PREFIX = "mod:"
+TAG_SPLIT_RE = re.compile(r"[\s,=]+")
+
+
+def split_id(item):
+    namespace, sep, path = item.lstrip("#").partition(":")
+    if not sep:
+        return DEFAULT_NAMESPACE, namespace
+    return namespace, path
+
+
+def tags_path(file_path):
+    return os.path.splitext(file_path)[0] + ".tags.txt"
+
+
+def read_tags(file_path):
+    tags = {}
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line.startswith("#"):
+                    continue
+                tag, *members = TAG_SPLIT_RE.split(line)
+                tags.setdefault(intern(tag.lower()), set()).update(intern(member.lower()) for member in members if member)
+    except OSError:
+        return {}
+    return tags
+
+
+def is_scope(term):
+    return term.startswith(MOD_PREFIX) and len(term) > len(MOD_PREFIX) or term.startswith("#") and len(term) > 1
+
+
+class ItemRegistry:
+    def __init__(self, items=(), tags=None):
+        self.items = items
+        self.namespaces = None
+        self.tags = {}
+        self.item_tags = {}
+        self.lock = threading.Lock()
+        self.build_tags(tags or {})
+
+    def ensure_namespaces(self):
+        with self.lock:
+            if self.namespaces is None:
+                self.namespaces = self.build_namespaces(self.items)
+            return self.namespaces
+
+    def build_namespaces(self, items):
+        entries = {}
+        for i, item in enumerate(items):
+            if not item:
+                continue
+            namespace, path = split_id(item.lower())
+            entries.setdefault(intern(namespace), []).append((intern(path), i))
+        namespaces = {}
+        for namespace, pairs in entries.items():
+            pairs.sort()
+            namespaces[namespace] = ([path for path, _ in pairs], array('I', (i for _, i in pairs)))
+        return namespaces
+
+    def build_tags(self, tags):
+        for tag in tags:
+            members = self.expand_tag(tag, tags, set())
+            self.tags[tag] = frozenset(members)
+            for member in members:
+                self.item_tags.setdefault(member, set()).add(tag)
+
+    def expand_tag(self, tag, tags, seen):
+        seen.add(tag)
+        members = set()
+        for member in tags.get(tag, ()):
+            if member.startswith("#"):
+                if member not in seen:
+                    members.update(self.expand_tag(member, tags, seen))
+            else:
+                members.add(member)
+        return members
+
+    def row(self, item):
+        namespace, path = split_id(item)
+        entry = self.ensure_namespaces().get(namespace)
+        if entry is None:
+            return None
+        paths, rows = entry
+        i = bisect_left(paths, path)
+        return rows[i] if i < len(paths) and paths[i] == path else None
+
+    def has_namespace(self, namespace):
+        return namespace in self.ensure_namespaces()
+
+    def namespace_rows(self, namespace):
+        entry = self.ensure_namespaces().get(namespace)
+        return entry[1] if entry is not None else array('I')
+
+    def mod_rows(self, namespace):
+        namespaces = self.ensure_namespaces()
+        if namespace in namespaces:
+            return namespaces[namespace][1]
+        rows = array('I')
+        for name in sorted(namespaces):
+            if name.startswith(namespace):
+                rows.extend(namespaces[name][1])
+        return rows
+
+    def tag_rows(self, tag):
+        rows = (self.row(member) for member in self.tags.get(tag, ()))
+        return array('I', sorted(row for row in rows if row is not None))
+
+    def scope_rows(self, term):
+        if term.startswith(MOD_PREFIX):
+            return self.mod_rows(term[len(MOD_PREFIX):])
+        return self.tag_rows(term)
+
+    def expand(self, item):
+        item = item.lower()
+        if item.startswith("#"):
+            return {item} | self.tags.get(item, frozenset())
+        return {item} | self.item_tags.get(item, set())
+
+
+def expand_filters(filters, registry):
+    return [(field, frozenset(registry.expand(value)) if field == "uses" else value) for field, value in filters]
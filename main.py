@@ -1,10 +1,42 @@
+import multiprocessing
+import os
 import sys
-from PyQt6.QtWidgets import QApplication
-from gui import CraftingGUI
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        from batch import main
+        sys.exit(main(sys.argv[2:]))
+
+    if "--profile" in sys.argv:
+        sys.argv.remove("--profile")
+        os.environ["KUBEJS_PROFILE"] = "1"
+
+    bench = "--startup-bench" in sys.argv
+    if bench:
+        sys.argv.remove("--startup-bench")
+    from startup import StartupTimer
+    timer = StartupTimer() if bench else None
+
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+    from gui import CraftingGUI
+    if timer:
+        timer.mark("imports")
+
     app = QApplication(sys.argv)
     window = CraftingGUI()
     window.resize(1000, 600)
+    if timer:
+        timer.mark("window constructed")
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+
+    def load():
+        if timer:
+            timer.mark("first paint")
+        loader = window.start_background_load(timer)
+        if timer:
+            loader.finished.connect(lambda: (print(timer.report()), app.quit()))
+
+    QTimer.singleShot(0, load)
+    sys.exit(app.exec())
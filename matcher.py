@@ -0,0 +1,94 @@
+import os
+
+CHECK_INTERVAL = 512
+BATCH_SIZE = 1 << 14
+MATCHER_ENV = "KUBEJS_MATCHER"
+
+
+class SearchCancelled(Exception):
+    pass
+
+
+def check_cancelled(cancelled, i):
+    if cancelled is not None and i % CHECK_INTERVAL == 0 and cancelled():
+        raise SearchCancelled()
+
+
+class FuzzyWuzzyMatcher:
+    name = "fuzzywuzzy"
+
+    def __init__(self):
+        from fuzzywuzzy import fuzz
+        self.partial_ratio = fuzz.partial_ratio
+
+    def score(self, query, choice):
+        return self.partial_ratio(query, choice)
+
+    def extract(self, query, choices, cutoff, cancelled=None):
+        matches = []
+        for i, choice in enumerate(choices):
+            check_cancelled(cancelled, i)
+            score = self.partial_ratio(query, choice)
+            if score >= cutoff:
+                matches.append((i, score))
+        return matches
+
+
+class RapidFuzzMatcher:
+    name = "rapidfuzz"
+
+    def __init__(self):
+        from rapidfuzz import fuzz, process
+        self.partial_ratio = fuzz.partial_ratio
+        self.process = process
+        try:
+            import numpy
+        except ImportError:
+            self.numpy = None
+        else:
+            self.numpy = numpy
+
+    def score(self, query, choice):
+        return round(self.partial_ratio(query, choice))
+
+    def extract_block(self, query, block, cutoff):
+        if self.numpy is not None:
+            scores = self.process.cdist([query], block, scorer=self.partial_ratio, score_cutoff=cutoff,
+                                        dtype=self.numpy.uint8, workers=-1)[0]
+            return [(int(i), int(scores[i])) for i in self.numpy.flatnonzero(scores >= cutoff)]
+        matches = self.process.extract(query, block, scorer=self.partial_ratio, score_cutoff=cutoff, limit=None)
+        matches = [(i, round(score)) for _, score, i in matches]
+        matches.sort()
+        return [(i, score) for i, score in matches if score >= cutoff]
+
+    def extract(self, query, choices, cutoff, cancelled=None):
+        matches = []
+        for start in range(0, len(choices), BATCH_SIZE):
+            if cancelled is not None and cancelled():
+                raise SearchCancelled()
+            block = choices[start:start + BATCH_SIZE]
+            matches.extend((start + i, score) for i, score in self.extract_block(query, block, cutoff))
+        return matches
+
+
+BACKENDS = {
+    RapidFuzzMatcher.name: RapidFuzzMatcher,
+    FuzzyWuzzyMatcher.name: FuzzyWuzzyMatcher,
+}
+_matcher = None
+
+
+def get_matcher():
+    global _matcher
+    if _matcher is None:
+        preferred = os.environ.get(MATCHER_ENV)
+        names = [preferred] if preferred in BACKENDS else list(BACKENDS)
+        for name in names:
+            try:
+                _matcher = BACKENDS[name]()
+                break
+            except ImportError:
+                continue
+        else:
+            raise ImportError("no fuzzy matching backend available (install rapidfuzz or fuzzywuzzy)")
+    return _matcher
@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from PyQt6.QtCore import QObject, QTimer
+
+MAX_EVENTS = 50000
+HEARTBEAT_MS = 50
+STALL_MS = 100
+
+
+class Profiler:
+    def __init__(self):
+        self.enabled = os.environ.get("KUBEJS_PROFILE", "") not in ("", "0")
+        self.origin = time.perf_counter()
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.threads = {}
+
+    def record(self, name, category, start, duration, args=None):
+        ident = threading.get_ident()
+        if ident not in self.threads:
+            self.threads[ident] = "GUI thread" if ident == threading.main_thread().ident else f"worker {len(self.threads)}"
+        self.events.append((name, category, start - self.origin, duration, ident, args))
+
+    @contextmanager
+    def span(self, name, category="gui", **args):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, category, start, time.perf_counter() - start, args or None)
+
+    def clear(self):
+        self.events.clear()
+
+    def summary(self):
+        durations = {}
+        for name, category, _, duration, _, _ in list(self.events):
+            durations.setdefault((category, name), []).append(duration * 1000)
+        rows = []
+        for (category, name), samples in durations.items():
+            samples.sort()
+            rows.append((category, name, len(samples), sum(samples), sum(samples) / len(samples),
+                         samples[min(len(samples) - 1, int(len(samples) * 0.95))], samples[-1]))
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def chrome_trace(self):
+        pid = os.getpid()
+        trace = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": ident, "args": {"name": name}}
+                 for ident, name in self.threads.items()]
+        for name, category, start, duration, ident, args in list(self.events):
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": ident,
+                     "ts": round(start * 1e6, 1), "dur": round(duration * 1e6, 1)}
+            if args:
+                event["args"] = args
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def export(self, file_path):
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+profiler = Profiler()
+
+
+class StallDetector(QObject):
+    def __init__(self, parent=None, interval=HEARTBEAT_MS, threshold=STALL_MS):
+        super().__init__(parent)
+        self.interval = interval / 1000
+        self.threshold = threshold / 1000
+        self.last = None
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.beat)
+
+    def start(self):
+        self.last = time.perf_counter()
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+
+    def beat(self):
+        now = time.perf_counter()
+        late = now - self.last - self.interval
+        if late >= self.threshold and profiler.enabled:
+            profiler.record("event loop stall", "stall", self.last + self.interval, late)
+        self.last = now
@@ -0,0 +1,148 @@
+from recipe_model import Recipe
+
+HEADER_JS = "ServerEvents.recipes(event => {\n"
+HEADER_TEXT = "// Recipes\n"
+FOOTER_JS = "})\n"
+SEPARATOR = "\n\n\n\n\n"
+
+
+def shaped_recipe(grid, output_item, count=1):
+    placeholder_grid = [[" " for _ in row] for row in grid]
+    mapping = {}
+    item_to_placeholder = {}
+    for row in range(len(grid)):
+        for col in range(len(grid[row])):
+            item = grid[row][col]
+            if item:
+                if item not in item_to_placeholder:
+                    placeholder = chr(ord('A') + len(item_to_placeholder))
+                    item_to_placeholder[item] = placeholder
+                    mapping[placeholder] = item
+                placeholder_grid[row][col] = item_to_placeholder[item]
+    return Recipe("shaped", output_item, count, mapping.values(),
+                  pattern=["".join(row) for row in placeholder_grid], key=mapping)
+
+
+def shapeless_recipe(inputs, output_item, count=1):
+    return Recipe("shapeless", output_item, count, [item for item in inputs if item])
+
+
+def crafting_recipe(grid, output_item, count=1, shaped=True):
+    if shaped:
+        return shaped_recipe(grid, output_item, count)
+    return shapeless_recipe([item for row in grid for item in row], output_item, count)
+
+
+def cooking_recipe(kind, input_item, output_item, count=1, xp=0.0, time=200):
+    return Recipe(kind, output_item, count, [input_item], xp=xp, time=time)
+
+
+def processing_recipe(kind, inputs, output_item, count=1, xp=None, time=None):
+    return Recipe(kind, output_item, count, [item for item in inputs if item], xp=xp, time=time)
+
+
+def group_inputs(inputs):
+    counts = {}
+    for item in inputs:
+        counts[item] = counts.get(item, 0) + 1
+    return list(counts.items())
+
+
+def render_shaped(recipe):
+    key = recipe.key or ()
+    recipe_grid = ",\n".join([f"    '{row}'" for row in recipe.pattern or ()])
+    recipe_mappings = "\n".join([
+        f"    {placeholder}: '{item}'" + ("," if idx < len(key) - 1 else "")
+        for idx, (placeholder, item) in enumerate(key)
+    ])
+    return (
+        f"event.shaped(\n"
+        f"  Item.of('{recipe.output}', {recipe.count}),\n"
+        f"  [\n{recipe_grid}\n  ],\n"
+        f"  {{\n{recipe_mappings}\n  }}\n)"
+    )
+
+
+def render_shapeless(recipe):
+    items_list = group_inputs(recipe.inputs)
+    text = (
+        f"event.shapeless(\n"
+        f"  Item.of('{recipe.output}', {recipe.count}),\n"
+        f"  [\n"
+    )
+    for idx, (item, count) in enumerate(items_list):
+        formatted_item = f"    '{count}x {item}'" if count > 1 else f"    '{item}'"
+        if idx < len(items_list) - 1:
+            formatted_item += ","
+        text += formatted_item + "\n"
+    text += "  ]\n)"
+    return text
+
+
+def render_inputs(inputs):
+    lines = [f"    '{count}x {item}'" if count > 1 else f"    '{item}'" for item, count in group_inputs(inputs)]
+    return "[\n" + ",\n".join(lines) + "\n  ]"
+
+
+def render_processing(recipe):
+    recipe_type = recipe.type
+    inputs = iter(recipe.inputs)
+    args = []
+    required = 0
+    for role in recipe_type.args:
+        if role == "output":
+            text = f"Item.of('{recipe.output}', {recipe.count})"
+        elif role == "inputs":
+            text = render_inputs(list(inputs))
+        elif role == "input":
+            item = next(inputs, None)
+            text = f"'{item}'" if item is not None else None
+            if not required:
+                required = len(args) + 1
+        else:
+            value = getattr(recipe, role)
+            text = f"{value}" if value is not None else None
+        args.append((role, text))
+        if text is not None and role in ("output", "inputs"):
+            required = len(args)
+    while len(args) > required and args[-1][1] is None:
+        args.pop()
+    args = [text if text is not None else ("''" if role == "input" else "0") for role, text in args]
+
+    text = f"event.{recipe_type.call}(\n  " + ",\n  ".join(args) + "\n)"
+    for method, role in recipe_type.chain.items():
+        value = getattr(recipe, role)
+        if role not in recipe_type.args and value is not None:
+            text += f".{method}({value})"
+    return text
+
+
+def render_recipe(recipe):
+    if recipe.kind == "shaped":
+        return render_shaped(recipe) + recipe.chain
+    if recipe.kind == "shapeless":
+        return render_shapeless(recipe) + recipe.chain
+    return render_processing(recipe) + recipe.chain
+
+
+def script_parts(recipes, is_js=True):
+    yield None, (HEADER_JS if is_js else HEADER_TEXT) + "\n"
+    for i, recipe in enumerate(recipes):
+        if i > 0:
+            yield None, SEPARATOR
+        yield None, "  "
+        yield recipe, render_recipe(recipe)
+        yield None, "\n"
+    if is_js:
+        yield None, FOOTER_JS
+
+
+def script_chunks(recipes, is_js=True):
+    for _, chunk in script_parts(recipes, is_js):
+        yield chunk
+
+
+def inserted_recipe_text(recipe, after_recipe, first=True):
+    if after_recipe:
+        return "\n" + SEPARATOR + "  ", render_recipe(recipe), ""
+    return ("  " if first else SEPARATOR + "  "), render_recipe(recipe), "\n"
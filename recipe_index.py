@@ -0,0 +1,102 @@
+from matcher import check_cancelled, get_matcher
+from search_index import FUZZY_CUTOFF
+
+QUERY_FIELDS = ("uses", "output", "type", "mod")
+
+
+def parse_query(search_text):
+    filters = []
+    terms = []
+    for term in search_text.split():
+        field, sep, value = term.partition(":")
+        if sep and value and field.lower() in QUERY_FIELDS:
+            filters.append((field.lower(), value.lower()))
+        else:
+            terms.append(term)
+    return filters, " ".join(terms)
+
+
+def namespace(item):
+    return item.lstrip("#").split(":", 1)[0] if ":" in item else "minecraft"
+
+
+def item_keys(item):
+    item = item.lower()
+    keys = {item}
+    if ":" in item:
+        prefix = "#" if item.startswith("#") else ""
+        keys.add(prefix + item.split(":", 1)[1])
+    return keys
+
+
+class RecipeIndex:
+    def __init__(self):
+        self.fields = {field: {} for field in QUERY_FIELDS}
+
+    def entries(self, recipe):
+        yield "type", recipe.kind.lower()
+        yield "type", recipe.type.group.lower()
+        if recipe.output:
+            for key in item_keys(recipe.output):
+                yield "output", key
+            yield "mod", namespace(recipe.output.lower())
+        for item in set(recipe.inputs):
+            if item:
+                for key in item_keys(item):
+                    yield "uses", key
+
+    def add(self, recipe):
+        for field, key in self.entries(recipe):
+            self.fields[field].setdefault(key, set()).add(recipe.id)
+
+    def remove(self, recipe):
+        for field, key in self.entries(recipe):
+            ids = self.fields[field].get(key)
+            if ids is not None:
+                ids.discard(recipe.id)
+                if not ids:
+                    del self.fields[field][key]
+
+    def clear(self):
+        for keys in self.fields.values():
+            keys.clear()
+
+    def lookup(self, field, value):
+        if isinstance(value, frozenset):
+            ids = set()
+            for key in value:
+                ids.update(self.fields[field].get(key, ()))
+            return ids
+        return self.fields[field].get(value, set())
+
+    def query(self, filters):
+        if len(filters) == 1:
+            return self.lookup(*filters[0])
+        result = None
+        for field, value in sorted(filters, key=lambda f: len(self.lookup(*f))):
+            ids = self.lookup(field, value)
+            result = set(ids) if result is None else result.intersection(ids)
+            if not result:
+                return set()
+        return result if result is not None else set()
+
+
+def search_recipes(search_text, all_recipes, cancelled=None):
+    terms = search_text.split()
+    scores = []
+    rest = []
+    choices = []
+    for i, recipe in enumerate(all_recipes):
+        check_cancelled(cancelled, i)
+        output_item = recipe.output.lower()
+
+        if all(term in output_item for term in terms):
+            scores.append((i, 100))
+        else:
+            rest.append(i)
+            choices.append(output_item)
+
+    for j, score in get_matcher().extract(search_text, choices, FUZZY_CUTOFF, cancelled):
+        scores.append((rest[j], score))
+    scores.sort(key=lambda x: (-x[1], x[0]))
+    return [(all_recipes[i], score) for i, score in scores]
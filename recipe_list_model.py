@@ -0,0 +1,58 @@
+import os
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+
+
+def recipe_label(recipe):
+    return f"[{recipe.type.title}] {recipe.output}"
+
+
+class RecipeListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.recipes = []
+        self.group_counts = {}
+        self.source_root = None
+
+    def set_recipes(self, recipes):
+        self.beginResetModel()
+        self.recipes = list(recipes)
+        self.group_counts = {}
+        for recipe in self.recipes:
+            rank = recipe.type.rank
+            self.group_counts[rank] = self.group_counts.get(rank, 0) + 1
+        self.endResetModel()
+
+    def insert_recipe(self, recipe):
+        rank = recipe.type.rank
+        row = sum(count for group, count in self.group_counts.items() if group <= rank)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.recipes.insert(row, recipe)
+        self.group_counts[rank] = self.group_counts.get(rank, 0) + 1
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        recipe = self.recipes.pop(row)
+        self.group_counts[recipe.type.rank] -= 1
+        self.endRemoveRows()
+        return recipe
+
+    def refresh(self):
+        if self.recipes:
+            self.dataChanged.emit(self.index(0), self.index(len(self.recipes) - 1))
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.recipes)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        recipe = self.recipes[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if self.source_root is not None and recipe.source is not None:
+                return f"{recipe_label(recipe)}  ({os.path.relpath(recipe.source, self.source_root)})"
+            return recipe_label(recipe)
+        if role == Qt.ItemDataRole.UserRole:
+            return recipe.id
+        return None
@@ -0,0 +1,206 @@
+from sys import intern
+from recipe_index import RecipeIndex
+from recipe_types import COOKING_GROUP, GROUPS, REGISTRY, kinds
+
+COOKING_KINDS = kinds(COOKING_GROUP)
+
+
+def intern_id(item):
+    return intern(item) if item is not None else None
+
+
+def trim_grid(rows):
+    width = max((len(row) for row in rows), default=0)
+    rows = [row + ("",) * (width - len(row)) for row in rows]
+    filled = [i for i, row in enumerate(rows) if any(row)]
+    if not filled:
+        return ()
+    rows = rows[filled[0]:filled[-1] + 1]
+    columns = [j for j in range(width) if any(row[j] for row in rows)]
+    return tuple(row[columns[0]:columns[-1] + 1] for row in rows)
+
+
+def by_group(recipes):
+    groups = [[] for _ in GROUPS]
+    for recipe in recipes:
+        groups[REGISTRY[recipe.kind].rank].append(recipe)
+    return [recipe for group in groups for recipe in group]
+
+
+class Recipe:
+    __slots__ = ("id", "kind", "output", "count", "inputs", "pattern", "key", "xp", "time", "span", "dirty", "source",
+                 "chain")
+
+    def __init__(self, kind, output, count=1, inputs=(), pattern=None, key=None, xp=None, time=None, span=None,
+                 source=None, chain=""):
+        self.id = None
+        self.kind = intern(kind)
+        self.output = intern_id(output)
+        self.count = count
+        self.inputs = tuple(intern_id(item) for item in inputs)
+        self.pattern = tuple(pattern) if pattern is not None else None
+        self.key = tuple((k, intern_id(v)) for k, v in key.items()) if key is not None else None
+        self.xp = xp
+        self.time = time
+        self.span = span
+        self.dirty = False
+        self.source = source
+        self.chain = chain
+
+    @property
+    def type(self):
+        return REGISTRY[self.kind]
+
+    def grid(self):
+        key = dict(self.key or ())
+        grid = trim_grid([tuple(key.get(symbol) or "" for symbol in row) for row in self.pattern or ()])
+        mirrored = tuple(tuple(reversed(row)) for row in grid)
+        return min(grid, mirrored)
+
+    def input_key(self):
+        if self.kind == "shaped":
+            return (self.kind, self.grid())
+        if "inputs" in self.type.args:
+            return (self.kind, tuple(sorted(self.inputs)))
+        return (self.kind, self.inputs)
+
+    def fingerprint(self):
+        return self.input_key(), (self.output, self.count)
+
+
+class ScriptState:
+    __slots__ = ("file_path", "signature", "insert_offset", "after_recipe", "removed_spans")
+
+    def __init__(self, file_path, signature, insert_offset, after_recipe):
+        self.file_path = file_path
+        self.signature = signature
+        self.insert_offset = insert_offset
+        self.after_recipe = after_recipe
+        self.removed_spans = []
+
+
+class RecipeStore:
+    def __init__(self):
+        self.recipes = {}
+        self.fingerprints = {}
+        self.outcomes = {}
+        self.index = RecipeIndex()
+        self.next_id = 0
+        self.sources = {}
+
+    def __len__(self):
+        return len(self.recipes)
+
+    def __iter__(self):
+        return iter(self.recipes.values())
+
+    def __contains__(self, recipe):
+        input_key, outcome = recipe.fingerprint()
+        return outcome in self.outcomes.get(input_key, ())
+
+    def conflicts(self, recipe):
+        input_key, outcome = recipe.fingerprint()
+        return [other for other in self.outcomes.get(input_key, ()) if other != outcome]
+
+    def collisions(self):
+        duplicates = 0
+        conflicts = []
+        for input_key, outcomes in self.outcomes.items():
+            duplicates += sum(outcomes.values()) - len(outcomes)
+            if len(outcomes) > 1:
+                conflicts.append((input_key, list(outcomes)))
+        return duplicates, conflicts
+
+    def track(self, recipe):
+        input_key, outcome = fingerprint = recipe.fingerprint()
+        self.fingerprints[recipe.id] = fingerprint
+        outcomes = self.outcomes.setdefault(input_key, {})
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    def untrack(self, recipe_id):
+        input_key, outcome = self.fingerprints.pop(recipe_id)
+        outcomes = self.outcomes[input_key]
+        if outcomes[outcome] > 1:
+            outcomes[outcome] -= 1
+        else:
+            del outcomes[outcome]
+            if not outcomes:
+                del self.outcomes[input_key]
+
+    def get(self, recipe_id):
+        return self.recipes.get(recipe_id)
+
+    def add(self, recipe):
+        recipe.id = self.next_id
+        self.next_id += 1
+        self.recipes[recipe.id] = recipe
+        self.track(recipe)
+        self.index.add(recipe)
+        return recipe.id
+
+    def remove(self, recipe_id, pending=True):
+        recipe = self.recipes.pop(recipe_id, None)
+        if recipe is None:
+            return None
+        self.untrack(recipe_id)
+        self.index.remove(recipe)
+        state = self.sources.get(recipe.source)
+        if pending and recipe.span is not None and state is not None:
+            state.removed_spans.append(recipe.span)
+        return recipe
+
+    def modify(self, recipes, edit):
+        changed = []
+        for recipe in recipes:
+            self.untrack(recipe.id)
+            self.index.remove(recipe)
+            if edit(recipe):
+                recipe.dirty = True
+                changed.append(recipe)
+            self.track(recipe)
+            self.index.add(recipe)
+        return changed
+
+    def clear(self):
+        self.recipes.clear()
+        self.fingerprints.clear()
+        self.outcomes.clear()
+        self.index.clear()
+        self.sources.clear()
+
+    def attach_source(self, file_path, signature, insert_offset, after_recipe, recipes=()):
+        self.sources[file_path] = ScriptState(file_path, signature, insert_offset, after_recipe)
+        for recipe in recipes:
+            recipe.source = file_path
+            recipe.dirty = False
+
+    def add_source(self, source):
+        for recipe in source.recipes:
+            recipe.source = source.file_path
+            self.add(recipe)
+        self.attach_source(source.file_path, source.signature, source.insert_offset, source.after_recipe)
+
+    def load(self, source):
+        self.clear()
+        self.add_source(source)
+
+    def load_many(self, sources):
+        self.clear()
+        for source in sources:
+            self.add_source(source)
+
+    def modified_files(self):
+        files = {file_path for file_path, state in self.sources.items() if state.removed_spans}
+        files.update(recipe.source for recipe in self.recipes.values()
+                     if (recipe.span is None or recipe.dirty) and recipe.source is not None)
+        return sorted(files)
+
+    def cooking(self, file_path=None):
+        return [recipe for recipe in self.recipes.values()
+                if recipe.kind in COOKING_KINDS and (file_path is None or recipe.source == file_path)]
+
+    def ordered(self, file_path=None):
+        return by_group(recipe for recipe in self.recipes.values() if file_path is None or recipe.source == file_path)
+
+    def query(self, filters):
+        return by_group(self.recipes[recipe_id] for recipe_id in sorted(self.index.query(filters)))
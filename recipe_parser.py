@@ -0,0 +1,347 @@
+import re
+from utils import file_signature
+from recipe_model import Recipe
+from recipe_types import CALLS
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)
+  | (?P<number>\d+(?:\.\d+)?(?:[eE][-+]?\d+)?|\.\d+)
+  | (?P<name>[A-Za-z_$][\w$]*)
+  | (?P<punct>=>|\.\.\.|[^\s\w])
+""", re.X | re.S)
+
+COUNT_RE = re.compile(r"^(\d+)x\s+(.+)$")
+STACK_CALLS = ("Item.of", "Ingredient.of")
+ESCAPE_RE = re.compile(r"\\(.)", re.S)
+
+
+class ParseError(Exception):
+    pass
+
+
+class Token:
+    __slots__ = ("kind", "value", "start", "end")
+
+    def __init__(self, kind, value, start, end):
+        self.kind = kind
+        self.value = value
+        self.start = start
+        self.end = end
+
+
+class Call:
+    __slots__ = ("name", "args")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+
+class Name:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+def tokenize(content):
+    tokens = []
+    for match in TOKEN_RE.finditer(content):
+        kind = match.lastgroup
+        if kind == "ws" or kind == "comment":
+            continue
+        tokens.append(Token(kind, match.group(), match.start(), match.end()))
+    return tokens
+
+
+def unquote(text):
+    return ESCAPE_RE.sub(r"\1", text[1:-1])
+
+
+def split_count(text):
+    match = COUNT_RE.match(text)
+    if match:
+        return match.group(2), int(match.group(1))
+    return text, 1
+
+
+def item_stack(call):
+    item, count = split_count(call.args[0])
+    if len(call.args) > 1:
+        count = call.args[1]
+    return item, count
+
+
+def number(value):
+    if not isinstance(value, (int, float)):
+        raise ParseError("expected a number")
+    return value
+
+
+def stack(value):
+    if isinstance(value, list) and len(value) == 1:
+        value = value[0]
+    if isinstance(value, str):
+        return split_count(value)
+    if isinstance(value, Call) and value.name in STACK_CALLS and value.args and isinstance(value.args[0], str) \
+            and (len(value.args) == 1 or len(value.args) == 2 and isinstance(value.args[1], int)):
+        return item_stack(value)
+    raise ParseError("unsupported ingredient")
+
+
+def ingredient(value):
+    item, count = stack(value)
+    if count != 1:
+        raise ParseError("input counts are not supported")
+    return item
+
+
+class Parser:
+    def __init__(self, content, tokens=None):
+        self.content = content
+        self.tokens = tokens if tokens is not None else tokenize(content)
+        self.pos = 0
+        self.truncated = False
+
+    def peek(self, offset=0):
+        i = self.pos + offset
+        return self.tokens[i] if i < len(self.tokens) else None
+
+    def is_punct(self, value, offset=0):
+        token = self.peek(offset)
+        return token is not None and token.kind == "punct" and token.value == value
+
+    def expect(self, value):
+        if not self.is_punct(value):
+            raise ParseError(f"expected '{value}'")
+        self.pos += 1
+
+    def parse_sequence(self, close):
+        values = []
+        while not self.is_punct(close):
+            if self.peek() is None:
+                raise ParseError(f"unterminated '{close}'")
+            values.append(self.parse_value())
+            if self.is_punct(","):
+                self.pos += 1
+            elif not self.is_punct(close):
+                raise ParseError("expected ','")
+        self.pos += 1
+        return values
+
+    def parse_object(self):
+        result = {}
+        while not self.is_punct("}"):
+            token = self.peek()
+            if token is None:
+                raise ParseError("unterminated '}'")
+            if token.kind == "string":
+                key = unquote(token.value)
+            elif token.kind in ("name", "number"):
+                key = token.value
+            else:
+                raise ParseError("bad object key")
+            self.pos += 1
+            self.expect(":")
+            result[key] = self.parse_value()
+            if self.is_punct(","):
+                self.pos += 1
+            elif not self.is_punct("}"):
+                raise ParseError("expected ','")
+        self.pos += 1
+        return result
+
+    def parse_value(self):
+        token = self.peek()
+        if token is None:
+            raise ParseError("unexpected end of script")
+        self.pos += 1
+        if token.kind == "string":
+            return unquote(token.value)
+        if token.kind == "number":
+            return float(token.value) if "." in token.value or "e" in token.value.lower() else int(token.value)
+        if token.kind == "punct":
+            if token.value == "-" and self.peek() is not None and self.peek().kind == "number":
+                value = self.parse_value()
+                return -value
+            if token.value == "[":
+                return self.parse_sequence("]")
+            if token.value == "{":
+                return self.parse_object()
+            raise ParseError(f"unexpected '{token.value}'")
+        name = token.value
+        while self.is_punct(".") and self.peek(1) is not None and self.peek(1).kind == "name":
+            name = f"{name}.{self.peek(1).value}"
+            self.pos += 2
+        if not self.is_punct("("):
+            return Name(name)
+        self.pos += 1
+        value = Call(name, self.parse_sequence(")"))
+        if self.is_punct(".") or self.is_punct("("):
+            raise ParseError("chained call in argument")
+        return value
+
+    def parse_chain(self, extras, known=()):
+        chain = []
+        while self.is_punct(".") and self.peek(1) is not None and self.peek(1).kind == "name" \
+                and self.is_punct("(", 2):
+            start = self.peek().start
+            method = self.peek(1).value
+            self.pos += 3
+            args = self.parse_sequence(")")
+            if method in known:
+                extras[method] = args[0] if args else None
+            else:
+                chain.append(self.content[start:self.tokens[self.pos - 1].end])
+        return "".join(chain)
+
+    def parse_fields(self, recipe_type, args, extras, span, chain):
+        if len(args) > len(recipe_type.args):
+            raise ParseError("too many arguments")
+        output, count = None, 1
+        inputs = []
+        pattern = key = None
+        fields = {}
+        for role, value in zip(recipe_type.args, args):
+            if role == "output":
+                output, count = stack(value)
+            elif role == "input":
+                item = ingredient(value)
+                if item:
+                    inputs.append(item)
+            elif role == "pattern":
+                if not isinstance(value, list) or not all(isinstance(row, str) for row in value):
+                    raise ParseError("expected a list of pattern rows")
+                pattern = value
+            elif role == "key":
+                if not isinstance(value, dict):
+                    raise ParseError("expected a key object")
+                key = {symbol: ingredient(item) for symbol, item in value.items()}
+                inputs.extend(item for item in key.values() if item)
+            elif role == "inputs":
+                if not isinstance(value, list):
+                    raise ParseError("expected a list of inputs")
+                for entry in value:
+                    item, amount = stack(entry)
+                    if item:
+                        inputs.extend([item] * amount)
+            else:
+                fields[role] = number(value)
+        for method, role in recipe_type.chain.items():
+            if method in extras:
+                value = number(extras[method])
+                if fields.get(role) is None:
+                    fields[role] = value
+        if not output:
+            raise ParseError("missing output item")
+        if recipe_type.has("pattern") and (pattern is None or key is None):
+            raise ParseError("missing pattern or key")
+        return Recipe(recipe_type.kind, output, count, inputs, pattern=pattern, key=key, xp=fields.get("xp"),
+                      time=fields.get("time"), span=span, chain=chain)
+
+    def parse_recipe(self, recipe_type, start):
+        first = self.pos
+        args = self.parse_sequence(")")
+        extras = {}
+        chain = self.parse_chain(extras, recipe_type.chain)
+        end = self.tokens[self.pos - 1].end
+        if any(token.kind == "string" and token.value[0] == "`" and "${" in token.value
+               for token in self.tokens[first:self.pos]):
+            raise ParseError("recipe built from template strings")
+
+        return self.parse_fields(recipe_type, args, extras, (start, end), chain)
+
+    def call_name(self):
+        token = self.peek(2)
+        if token is None or token.kind != "name":
+            return None, 0
+        call = token.value
+        offset = 3
+        if call == "recipes":
+            while self.is_punct(".", offset) and self.peek(offset + 1) is not None \
+                    and self.peek(offset + 1).kind == "name":
+                call = f"{call}.{self.peek(offset + 1).value}"
+                offset += 2
+        return call, offset
+
+    def parse(self, kinds=None):
+        recipes = []
+        tokens = self.tokens
+        while self.pos < len(tokens):
+            token = tokens[self.pos]
+            if token.kind == "name" and token.value == "event" and self.is_punct(".", 1):
+                call, offset = self.call_name()
+                recipe_type = CALLS.get(call)
+                if recipe_type is not None and self.is_punct("(", offset) \
+                        and (kinds is None or recipe_type.kind in kinds):
+                    start = token.start
+                    self.pos += offset + 1
+                    resume = self.pos
+                    try:
+                        recipes.append(self.parse_recipe(recipe_type, start))
+                    except (ParseError, IndexError):
+                        self.truncated = self.truncated or self.pos >= len(tokens)
+                        self.pos = resume
+                    continue
+            self.pos += 1
+        return recipes
+
+
+def parse_script(content, kinds=None):
+    return Parser(content).parse(kinds)
+
+
+def parse_recipe_text(text):
+    recipes = parse_script(text)
+    if not recipes:
+        return None
+    recipes[0].span = None
+    return recipes[0]
+
+
+class ScriptSource:
+    def __init__(self, file_path, recipes, insert_offset, after_recipe, signature):
+        self.file_path = file_path
+        self.recipes = recipes
+        self.insert_offset = insert_offset
+        self.after_recipe = after_recipe
+        self.signature = signature
+
+
+def byte_spans(content, recipes):
+    position = 0
+    offset = 0
+    for recipe in recipes:
+        start, end = recipe.span
+        offset += len(content[position:start].encode('utf-8'))
+        byte_start = offset
+        offset += len(content[start:end].encode('utf-8'))
+        recipe.span = (byte_start, offset)
+        position = end
+
+
+def insert_point(content, recipes):
+    if recipes:
+        return recipes[-1].span[1], True
+    footer = content.rfind("})")
+    if footer < 0:
+        return len(content.encode('utf-8')), False
+    line_start = content.rfind("\n", 0, footer) + 1
+    return len(content[:line_start].encode('utf-8')), False
+
+
+def read_script(file_path, kinds=None):
+    signature = file_signature(file_path)
+    with open(file_path, 'rb') as f:
+        content = f.read().decode('utf-8')
+    recipes = parse_script(content, kinds)
+    if not content.isascii():
+        byte_spans(content, recipes)
+    insert_offset, after_recipe = insert_point(content, recipes)
+    return ScriptSource(file_path, recipes, insert_offset, after_recipe, signature)
+
+
+def load_script(file_path, kinds=None):
+    return read_script(file_path, kinds).recipes
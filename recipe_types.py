@@ -0,0 +1,84 @@
+CRAFTING_GROUP = "crafting"
+COOKING_GROUP = "cooking"
+INPUT_SLOTS = 3
+
+
+class RecipeType:
+    __slots__ = ("kind", "call", "label", "title", "group", "tab", "args", "chain", "default_time", "rank")
+
+    def __init__(self, kind, label, group, args, title=None, tab="processing", call=None, chain=None,
+                 default_time=None):
+        self.kind = kind
+        self.call = call or kind
+        self.label = label
+        self.title = title or label
+        self.group = group
+        self.tab = tab
+        self.args = args
+        self.chain = chain or {}
+        self.default_time = default_time
+        self.rank = 0
+
+    def has(self, role):
+        return role in self.args or role in self.chain.values()
+
+    def input_slots(self):
+        if "inputs" in self.args:
+            return INPUT_SLOTS
+        return self.args.count("input")
+
+
+REGISTRY = {}
+CALLS = {}
+GROUPS = []
+
+
+def register(recipe_type):
+    if recipe_type.group not in GROUPS:
+        GROUPS.append(recipe_type.group)
+    recipe_type.rank = GROUPS.index(recipe_type.group)
+    REGISTRY[recipe_type.kind] = recipe_type
+    CALLS[recipe_type.call] = recipe_type
+    return recipe_type
+
+
+def recipe_type(kind):
+    return REGISTRY[kind]
+
+
+def kinds(group=None):
+    return tuple(kind for kind, recipe_type in REGISTRY.items() if group is None or recipe_type.group == group)
+
+
+def tab_types(tab):
+    return [recipe_type for recipe_type in REGISTRY.values() if recipe_type.tab == tab]
+
+
+def modded(mod, machine, label, args, chain=None):
+    return register(RecipeType(f"{mod}.{machine}", label, mod, args, title=f"{mod.capitalize()} {label}",
+                               call=f"recipes.{mod}.{machine}", chain=chain))
+
+
+COOKING_ARGS = ("output", "input", "xp", "time")
+COOKING_CHAIN = {"xp": "xp", "cookingTime": "time"}
+PROCESSING_CHAIN = {"processingTime": "time"}
+
+register(RecipeType("shaped", "Shaped", CRAFTING_GROUP, ("output", "pattern", "key"), title="Crafting Table",
+                    tab=CRAFTING_GROUP))
+register(RecipeType("shapeless", "Shapeless", CRAFTING_GROUP, ("output", "inputs"), title="Crafting Table",
+                    tab=CRAFTING_GROUP))
+for kind, label, default_time in [("smelting", "Smelting", 200), ("blasting", "Blasting", 100),
+                                  ("smoking", "Smoking", 100), ("campfireCooking", "Campfire Cooking", 600)]:
+    register(RecipeType(kind, label, COOKING_GROUP, COOKING_ARGS, title="Smelting/Cooking", tab=COOKING_GROUP,
+                        chain=COOKING_CHAIN, default_time=default_time))
+register(RecipeType("stonecutting", "Stonecutting", "stonecutting", ("output", "input")))
+register(RecipeType("smithing", "Smithing", "smithing", ("output", "input", "input", "input")))
+
+for machine, label in [("crushing", "Crushing"), ("milling", "Milling"), ("pressing", "Pressing"),
+                       ("cutting", "Cutting"), ("splashing", "Splashing"), ("haunting", "Haunting")]:
+    modded("create", machine, label, ("output", "input"), PROCESSING_CHAIN)
+for machine, label in [("mixing", "Mixing"), ("compacting", "Compacting"), ("deploying", "Deploying")]:
+    modded("create", machine, label, ("output", "inputs"), PROCESSING_CHAIN)
+for machine, label in [("crushing", "Crushing"), ("enriching", "Enriching"), ("smelting", "Smelting")]:
+    modded("mekanism", machine, label, ("output", "input"))
+modded("mekanism", "combining", "Combining", ("output", "input", "input"))
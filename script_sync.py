@@ -0,0 +1,157 @@
+import re
+from recipe_parser import TOKEN_RE, Parser, byte_spans, insert_point
+from utils import file_signature
+
+
+TOKEN_BYTES_RE = re.compile(TOKEN_RE.pattern.encode('utf-8'), re.X | re.S)
+MULTILINE_TOKENS = (b"/*", b"*/", b"`")
+
+
+class SyncReport:
+    def __init__(self):
+        self.added = []
+        self.removed = []
+        self.conflicts = []
+
+
+def common_prefix(a, b):
+    lo, hi = 0, min(len(a), len(b))
+    a, b = memoryview(a), memoryview(b)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def common_suffix(a, b, limit):
+    lo, hi = 0, min(len(a), len(b)) - limit
+    a, b = memoryview(a), memoryview(b)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len(a) - mid:len(a) - lo] == b[len(b) - mid:len(b) - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def changed_range(old, new):
+    prefix = common_prefix(old, new)
+    suffix = common_suffix(old, new, prefix)
+    return prefix, len(old) - suffix
+
+
+def token_aligned(content, start, end):
+    for match in TOKEN_BYTES_RE.finditer(content, start):
+        if match.end() >= end:
+            return match.end() == end or match.start() >= end
+    return True
+
+
+def parse_region(content, start, end):
+    text = content[start:end].decode('utf-8')
+    parser = Parser(text)
+    recipes = parser.parse()
+    if end < len(content) and (parser.truncated or not token_aligned(content, start, end)):
+        return None
+    if not text.isascii():
+        byte_spans(text, recipes)
+    for recipe in recipes:
+        recipe.span = (recipe.span[0] + start, recipe.span[1] + start)
+    return recipes
+
+
+def sync_script(store, file_path, old_content, new_content):
+    report = SyncReport()
+    state = store.sources[file_path]
+    recipes = sorted((recipe for recipe in store if recipe.source == file_path and recipe.span is not None),
+                     key=lambda recipe: recipe.span[0])
+    if old_content is None:
+        change_start, change_end = 0, len(new_content)
+        delta = 0
+        region_start, region_end = 0, None
+    else:
+        change_start, change_end = changed_range(old_content, new_content)
+        delta = len(new_content) - len(old_content)
+        line_start = new_content.rfind(b"\n", 0, change_start) + 1
+        before = [recipe for recipe in recipes if recipe.span[1] <= line_start][:-1]
+        after = [recipe for recipe in recipes if recipe.span[0] > change_end]
+        region_start = before[-1].span[1] if before else 0
+        region_end = after[0].span[0] if after else len(old_content)
+        context = (old_content[max(0, change_start - 1):change_end + 1],
+                   new_content[max(0, change_start - 1):change_end + delta + 1])
+        if any(token in text for text in context for token in MULTILINE_TOKENS):
+            region_end = None
+    parsed = parse_region(new_content, region_start, region_end + delta) if region_end is not None else None
+    if parsed is None:
+        region_start, region_end = 0, len(new_content) - delta
+        parsed = parse_region(new_content, 0, len(new_content))
+    before = [recipe for recipe in recipes if recipe.span[1] <= region_start]
+    after = [recipe for recipe in recipes if recipe.span[0] >= region_end]
+    affected = recipes[len(before):len(recipes) - len(after)]
+
+    def moved(span):
+        if old_content is None:
+            return None
+        if span[1] <= change_start:
+            return span
+        if span[0] >= change_end:
+            return span[0] + delta, span[1] + delta
+        return None
+
+    pending = {}
+    removed_spans = []
+    for span in state.removed_spans:
+        if span[1] <= region_start or span[0] >= region_end:
+            removed_spans.append(moved(span))
+            continue
+        new_span = moved(span)
+        if new_span is None:
+            report.conflicts.append("a recipe deleted in the app was changed on disk and has been restored")
+        else:
+            pending[new_span] = span
+
+    def replace(recipe):
+        if recipe.dirty:
+            report.conflicts.append(f"unsaved edits to {recipe.output} were replaced by the version on disk")
+        store.remove(recipe.id, pending=False)
+        report.removed.append(recipe)
+
+    kept = {}
+    for recipe in affected:
+        new_span = moved(recipe.span)
+        if new_span is None:
+            replace(recipe)
+        else:
+            kept[new_span] = recipe
+
+    for recipe in parsed:
+        if recipe.span in pending:
+            removed_spans.append(recipe.span)
+            continue
+        previous = kept.pop(recipe.span, None)
+        if previous is not None:
+            previous.span = recipe.span
+            continue
+        recipe.source = file_path
+        store.add(recipe)
+        report.added.append(recipe)
+    for recipe in kept.values():
+        replace(recipe)
+
+    for recipe in after:
+        recipe.span = (recipe.span[0] + delta, recipe.span[1] + delta)
+
+    spans = [recipe.span[1] for recipe in store if recipe.source == file_path and recipe.span is not None]
+    if spans:
+        insert_offset, after_recipe = max(spans), True
+    else:
+        insert_offset, after_recipe = insert_point(new_content.decode('utf-8'), [])
+    state.signature = file_signature(file_path)
+    state.insert_offset = insert_offset
+    state.after_recipe = after_recipe
+    state.removed_spans = sorted(removed_spans)
+    return report
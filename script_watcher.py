@@ -0,0 +1,58 @@
+import os
+from PyQt6.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+SETTLE_MS = 200
+
+
+def read_bytes(file_path):
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+class ScriptWatcher(QObject):
+    changed = pyqtSignal(str)
+
+    def __init__(self, parent=None, delay=SETTLE_MS):
+        super().__init__(parent)
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.queue)
+        self.snapshots = {}
+        self.queued = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.flush)
+
+    def watch(self, paths):
+        paths = set(paths)
+        watched = set(self.watcher.files())
+        if watched - paths:
+            self.watcher.removePaths(list(watched - paths))
+        self.snapshots = {file_path: self.snapshots.get(file_path) if file_path in watched else read_bytes(file_path)
+                          for file_path in paths}
+        missing = [file_path for file_path in paths - watched if os.path.exists(file_path)]
+        if missing:
+            self.watcher.addPaths(missing)
+
+    def refresh(self, paths):
+        for file_path in paths:
+            self.snapshots[file_path] = read_bytes(file_path)
+            if file_path not in self.watcher.files() and os.path.exists(file_path):
+                self.watcher.addPath(file_path)
+
+    def queue(self, file_path):
+        self.queued.add(file_path)
+        self.timer.start()
+
+    def flush(self):
+        queued = sorted(self.queued)
+        self.queued.clear()
+        for file_path in queued:
+            if file_path not in self.snapshots:
+                continue
+            if file_path not in self.watcher.files() and os.path.exists(file_path):
+                self.watcher.addPath(file_path)
+            self.changed.emit(file_path)
@@ -0,0 +1,265 @@
+import itertools
+import os
+import shutil
+import tempfile
+from recipe_generator import FOOTER_JS, inserted_recipe_text, render_recipe, script_parts
+from recipe_parser import read_script
+from utils import file_signature
+
+CHUNK_SIZE = 1 << 16
+LOOKBEHIND = 4096
+WHITESPACE = (b" ", b"\t", b"\r", b"\n")
+
+
+def write_chunks(f, chunks, encoding='utf-8'):
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= CHUNK_SIZE:
+            f.write("".join(buffer).encode(encoding))
+            buffer.clear()
+            size = 0
+    if buffer:
+        f.write("".join(buffer).encode(encoding))
+
+
+def fsync_directory(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(file_path, chunks, encoding='utf-8'):
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(file_path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if encoding is None:
+                for chunk in chunks:
+                    f.write(chunk)
+            else:
+                write_chunks(f, chunks, encoding)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    fsync_directory(directory)
+
+
+class Edit:
+    __slots__ = ("start", "end", "prefix", "text", "suffix", "recipe", "trim")
+
+    def __init__(self, start, end, prefix=b"", text=b"", suffix=b"", recipe=None, trim=False):
+        self.start = start
+        self.end = end
+        self.prefix = prefix
+        self.text = text
+        self.suffix = suffix
+        self.recipe = recipe
+        self.trim = trim
+
+    def data(self):
+        return self.prefix + self.text + self.suffix
+
+
+def copy_prefix(file_path, size):
+    with open(file_path, 'rb') as f:
+        while size > 0:
+            chunk = f.read(min(CHUNK_SIZE, size))
+            if not chunk:
+                return
+            size -= len(chunk)
+            yield chunk
+
+
+def patch_file(file_path, edits):
+    edits.sort(key=lambda edit: (edit.start, edit.end))
+    base = max(0, edits[0].start - LOOKBEHIND)
+    with open(file_path, 'rb') as f:
+        f.seek(base)
+        tail = f.read()
+    floor = base
+    for edit in edits:
+        if edit.trim:
+            while edit.start > floor and tail[edit.start - base - 1:edit.start - base] in WHITESPACE:
+                edit.start -= 1
+        floor = edit.end
+
+    parts = []
+    position = base
+    for edit in edits:
+        parts.append(tail[position - base:edit.start - base])
+        parts.append(edit.data())
+        position = edit.end
+    parts.append(tail[position - base:])
+
+    write_atomic(file_path, itertools.chain(copy_prefix(file_path, base), parts), encoding=None)
+    return edits
+
+
+def shift_spans(recipes, edits):
+    edited = {id(edit.recipe) for edit in edits if edit.recipe is not None}
+    untouched = sorted((recipe for recipe in recipes if recipe.span is not None and id(recipe) not in edited),
+                       key=lambda recipe: recipe.span[0])
+    position = 0
+    delta = 0
+    for recipe in untouched:
+        while position < len(edits) and edits[position].end <= recipe.span[0]:
+            edit = edits[position]
+            delta += len(edit.data()) - (edit.end - edit.start)
+            position += 1
+        recipe.span = (recipe.span[0] + delta, recipe.span[1] + delta)
+
+    delta = 0
+    for edit in edits:
+        if edit.recipe is not None:
+            text_start = edit.start + delta + len(edit.prefix)
+            edit.recipe.span = (text_start, text_start + len(edit.text))
+        delta += len(edit.data()) - (edit.end - edit.start)
+
+
+def pending_edits(state, recipes, encoding='utf-8'):
+    edits = [Edit(start, end, trim=True) for start, end in state.removed_spans]
+    first = True
+    for recipe in recipes:
+        if recipe.span is None:
+            prefix, text, suffix = inserted_recipe_text(recipe, state.after_recipe, first)
+            edits.append(Edit(state.insert_offset, state.insert_offset, prefix.encode(encoding),
+                              text.encode(encoding), suffix.encode(encoding), recipe))
+            first = False
+        elif recipe.dirty:
+            edits.append(Edit(recipe.span[0], recipe.span[1], text=render_recipe(recipe).encode(encoding),
+                              recipe=recipe))
+    return edits
+
+
+def shift_offset(offset, edits):
+    delta = 0
+    for edit in edits:
+        if edit.end <= offset:
+            delta += len(edit.data()) - (edit.end - edit.start)
+    return offset + delta
+
+
+def save_incremental(store, file_path, recipes):
+    state = store.sources[file_path]
+    edits = pending_edits(state, recipes)
+    if edits:
+        patch_file(file_path, edits)
+        shift_spans(recipes, edits)
+    if recipes:
+        insert_offset, after_recipe = max(recipe.span[1] for recipe in recipes), True
+    else:
+        insert_offset, after_recipe = shift_offset(state.insert_offset, edits), state.after_recipe
+    store.attach_source(file_path, file_signature(file_path), insert_offset, after_recipe, recipes)
+    return len(edits)
+
+
+def save_full(store, file_path, is_js, recipes):
+    spans = []
+    position = 0
+
+    def chunks():
+        nonlocal position
+        for recipe, chunk in script_parts(recipes, is_js):
+            size = len(chunk.encode('utf-8'))
+            if recipe is not None:
+                spans.append((recipe, position, position + size))
+            position += size
+            yield chunk
+
+    write_atomic(file_path, chunks())
+    for recipe, start, end in spans:
+        recipe.span = (start, end)
+    if recipes:
+        insert_offset, after_recipe = recipes[-1].span[1], True
+    else:
+        insert_offset, after_recipe = position - len(FOOTER_JS) if is_js else position, False
+    store.attach_source(file_path, file_signature(file_path), insert_offset, after_recipe, recipes)
+
+
+def claim(candidates, recipes, key):
+    claimed = []
+    for recipe in recipes:
+        matches = candidates.get(key(recipe))
+        if matches:
+            recipe.span = matches.pop().span
+            claimed.append(recipe)
+    return claimed
+
+
+def save_merged(store, file_path, recipes):
+    loaded = file_path in store.sources
+    source = read_script(file_path)
+    on_disk = {}
+    for recipe in reversed(source.recipes):
+        on_disk.setdefault(render_recipe(recipe), []).append(recipe)
+    for recipe in recipes:
+        recipe.span = None
+    unchanged = {id(recipe) for recipe in claim(on_disk, recipes, render_recipe)}
+
+    leftover = {}
+    for matches in on_disk.values():
+        for recipe in matches:
+            leftover.setdefault((recipe.kind, recipe.output), []).append(recipe)
+    for matches in leftover.values():
+        matches.sort(key=lambda recipe: recipe.span[0], reverse=True)
+    edited = claim(leftover, [recipe for recipe in recipes if recipe.span is None],
+                   lambda recipe: (recipe.kind, recipe.output)) if loaded else []
+
+    store.attach_source(file_path, source.signature, source.insert_offset, source.after_recipe,
+                        [recipe for recipe in recipes if id(recipe) in unchanged])
+    for recipe in recipes:
+        recipe.source = file_path
+    for recipe in edited:
+        recipe.dirty = True
+    if loaded:
+        store.sources[file_path].removed_spans = sorted(
+            recipe.span for matches in leftover.values() for recipe in matches)
+    return save_incremental(store, file_path, recipes)
+
+
+def has_content(file_path):
+    with open(file_path, 'rb') as f:
+        return bool(f.read().strip())
+
+
+def save_script(store, file_path, recipes=None):
+    is_js = file_path.endswith('.js')
+    if recipes is None:
+        recipes = store.ordered()
+    state = store.sources.get(file_path)
+    if state is not None and (recipes or state.removed_spans) and os.path.exists(file_path) \
+            and file_signature(file_path) == state.signature \
+            and all(recipe.source in (file_path, None) for recipe in recipes):
+        save_incremental(store, file_path, recipes)
+        return True
+    if os.path.exists(file_path) and has_content(file_path):
+        save_merged(store, file_path, recipes)
+        return True
+    save_full(store, file_path, is_js, recipes)
+    return False
+
+
+def save_workspace(store):
+    saved = []
+    for file_path in store.modified_files():
+        save_script(store, file_path, store.ordered(file_path))
+        saved.append(file_path)
+    return saved
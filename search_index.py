@@ -0,0 +1,174 @@
+import threading
+from array import array
+from item_registry import ItemRegistry, is_scope
+from matcher import CHECK_INTERVAL, check_cancelled, get_matcher
+
+GRAM_SIZE = 3
+FUZZY_CUTOFF = 70
+
+
+def normalize(text):
+    return text.lower().replace("_", " ")
+
+
+def grams(text):
+    return {text[i:i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+class ItemSearchIndex:
+    def __init__(self, items=(), lazy=False, cache=None, tags=None):
+        self.items = items
+        self.keys = None
+        self.postings = None
+        self.registry = ItemRegistry(items, tags)
+        self.cache = cache
+        self.lock = threading.Lock()
+        if not lazy:
+            self.build(items)
+
+    def ensure_built(self):
+        with self.lock:
+            if self.keys is not None:
+                return
+            state = self.cache.load() if self.cache is not None else None
+            if state is not None:
+                self.keys, self.postings = state
+                return
+            self.build(self.items)
+            if self.cache is not None:
+                self.cache.save((self.keys, self.postings))
+
+    def build(self, items):
+        keys = [normalize(item) for item in items]
+        postings = {}
+        for i, key in enumerate(keys):
+            for gram in grams(key):
+                bucket = postings.get(gram)
+                if bucket is None:
+                    bucket = postings[gram] = array('I')
+                bucket.append(i)
+        self.items, self.keys, self.postings = items, keys, postings
+
+    def __len__(self):
+        return len(self.items)
+
+    def term_candidates(self, terms, postings):
+        result = None
+        for term in terms:
+            for gram in grams(term):
+                bucket = postings.get(gram)
+                if bucket is None:
+                    return set()
+                result = set(bucket) if result is None else result.intersection(bucket)
+                if not result:
+                    return result
+        return result
+
+    def term_matches(self, terms, cancelled=None, within=None):
+        self.ensure_built()
+        keys = self.keys
+        if within is not None:
+            candidates = within
+        else:
+            candidates = self.term_candidates(terms, self.postings)
+            candidates = range(len(keys)) if candidates is None else sorted(candidates)
+        exact = array('I')
+        for start in range(0, len(candidates), CHECK_INTERVAL):
+            check_cancelled(cancelled, start)
+            block = candidates[start:start + CHECK_INTERVAL]
+            if len(terms) == 1:
+                term = terms[0]
+                exact.extend(i for i in block if term in keys[i])
+            else:
+                exact.extend(i for i in block if all(term in keys[i] for term in terms))
+        return exact
+
+    def fuzzy_matches(self, search_text, exact, cancelled=None, within=None):
+        self.ensure_built()
+        keys = self.keys
+        if not exact and within is None:
+            fuzzy_pool, choices = range(len(keys)), keys
+        else:
+            exact_set = set(exact)
+            pool = range(len(keys)) if within is None else within
+            fuzzy_pool = [i for i in pool if i not in exact_set]
+            choices = [keys[i] for i in fuzzy_pool]
+        matches = get_matcher().extract(search_text, choices, FUZZY_CUTOFF, cancelled)
+        partial = [(fuzzy_pool[j], score) for j, score in matches]
+        partial.sort(key=lambda x: x[1], reverse=True)
+        return [i for i, _ in partial]
+
+    def scoped(self, terms):
+        self.ensure_built()
+        registry = self.registry
+        scope = None
+        rest = []
+        for term in terms:
+            if is_scope(term):
+                rows = registry.scope_rows(term)
+            else:
+                namespace, sep, path = term.partition(":")
+                if not sep or not registry.has_namespace(namespace):
+                    rest.append(term)
+                    continue
+                rows = registry.namespace_rows(namespace)
+                rest.extend(normalize(path).split())
+            scope = rows if scope is None else set(scope).intersection(rows)
+        if scope is None:
+            return None, terms
+        return array('I', sorted(scope)), rest
+
+    def search(self, search_text, cancelled=None, within=None):
+        search_text = search_text.strip().lower()
+        if not search_text:
+            return array('I', range(len(self.items)))
+
+        terms = search_text.split()
+        scope, rest = self.scoped(terms)
+        if scope is not None:
+            if within is not None:
+                keep = set(within)
+                scope = array('I', (i for i in scope if i in keep))
+            if not rest:
+                return scope
+            terms, within = rest, scope
+            search_text = " ".join(rest)
+
+        exact = self.term_matches(terms, cancelled, within)
+        rows = array('I', exact)
+        rows.extend(self.fuzzy_matches(search_text, exact, cancelled, scope))
+        return rows
+
+
+class SearchSession:
+    def __init__(self, index):
+        self.index = index
+        self.query = None
+        self.survivors = None
+
+    def invalidate(self):
+        self.query = None
+        self.survivors = None
+
+    def search(self, search_text, cancelled=None):
+        search_text = search_text.strip().lower()
+        if not search_text:
+            self.invalidate()
+            return array('I', range(len(self.index)))
+
+        terms = search_text.split()
+        if self.index.scoped(terms)[0] is not None:
+            self.invalidate()
+            return self.index.search(search_text, cancelled)
+        if self.query and search_text.startswith(self.query):
+            known = len(self.query.split())
+            if not search_text[len(self.query):len(self.query) + 1].isspace():
+                known -= 1
+            exact = self.index.term_matches(terms[known:], cancelled, self.survivors)
+        else:
+            exact = self.index.term_matches(terms, cancelled)
+        self.query, self.survivors = search_text, exact
+
+        rows = array('I', exact)
+        rows.extend(self.index.fuzzy_matches(search_text, exact, cancelled))
+        return rows
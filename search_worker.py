@@ -0,0 +1,68 @@
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+from matcher import SearchCancelled
+from profiler import profiler
+
+DEBOUNCE_MS = 150
+
+
+class CancelToken:
+    def __init__(self, worker, generation):
+        self.worker = worker
+        self.generation = generation
+
+    def __call__(self):
+        return self.generation != self.worker.generation
+
+
+class SearchTask(QRunnable):
+    def __init__(self, worker, job, token):
+        super().__init__()
+        self.worker = worker
+        self.job = job
+        self.token = token
+
+    def run(self):
+        try:
+            with profiler.span(self.worker.objectName() or "search", "worker"):
+                results = self.job(self.token)
+        except SearchCancelled:
+            return
+        if not self.token():
+            self.worker.finished.emit(self.token.generation, results)
+
+
+class SearchWorker(QObject):
+    results_ready = pyqtSignal(object)
+    finished = pyqtSignal(int, object)
+
+    def __init__(self, task_factory, parent=None, delay=DEBOUNCE_MS):
+        super().__init__(parent)
+        self.task_factory = task_factory
+        self.generation = 0
+        self.query = None
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(delay)
+        self.timer.timeout.connect(self.start_search)
+        self.finished.connect(self.deliver)
+
+    def schedule(self, query):
+        self.cancel()
+        self.query = query
+        self.timer.start()
+
+    def cancel(self):
+        self.generation += 1
+        self.timer.stop()
+        self.pool.clear()
+
+    def start_search(self):
+        job = self.task_factory(self.query)
+        token = CancelToken(self, self.generation)
+        self.pool.start(SearchTask(self, job, token))
+
+    def deliver(self, generation, results):
+        if generation == self.generation:
+            self.results_ready.emit(results)
@@ -0,0 +1,67 @@
+import time
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from profiler import profiler
+
+
+class StartupTimer:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = []
+
+    def mark(self, phase):
+        now = time.perf_counter()
+        self.phases.append((phase, now - self.last, now - self.start))
+        self.last = now
+
+    def report(self):
+        lines = [f"{'phase':<24}{'step ms':>10}{'total ms':>10}"]
+        for phase, step, total in self.phases:
+            lines.append(f"{phase:<24}{step * 1000:>10.1f}{total * 1000:>10.1f}")
+        return "\n".join(lines)
+
+
+class StartupStep(QRunnable):
+    def __init__(self, loader):
+        super().__init__()
+        self.loader = loader
+
+    def run(self):
+        steps = self.loader.steps
+        for i, (label, work, _) in enumerate(steps):
+            self.loader.progress.emit(i, len(steps), label)
+            try:
+                with profiler.span(label, "startup"):
+                    result = work()
+            except Exception as e:
+                self.loader.failed.emit(label, str(e))
+                continue
+            self.loader.step_done.emit(i, result)
+        self.loader.progress.emit(len(steps), len(steps), "")
+        self.loader.finished.emit()
+
+
+class StartupLoader(QObject):
+    progress = pyqtSignal(int, int, str)
+    step_done = pyqtSignal(int, object)
+    failed = pyqtSignal(str, str)
+    finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.steps = []
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.step_done.connect(self.deliver)
+
+    def add_step(self, label, work, done=None):
+        self.steps.append((label, work, done))
+
+    def start(self):
+        self.pool.start(StartupStep(self))
+
+    def deliver(self, i, result):
+        label, _, done = self.steps[i]
+        if done is not None:
+            with profiler.span(label, "gui"):
+                done(result)
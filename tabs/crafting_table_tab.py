@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QSpinBox, QSlider, QPushButton, QLineEdit, QHBoxLayout, QSizePolicy, QCheckBox, QFileDialog
 from PyQt6.QtCore import Qt
+from recipe_generator import crafting_recipe, render_recipe
 
 class CraftingTableTab(QWidget):
     def __init__(self, shared_item_list, parent_gui):
@@ -10,7 +11,6 @@ class CraftingTableTab(QWidget):
         self.output_item = None
         self.item_list = shared_item_list
         self.parent_gui = parent_gui
-        self.recipes = []
         self.is_shaped = True
         self.init_ui()
 
@@ -139,7 +139,7 @@ class CraftingTableTab(QWidget):
         if file_path:
             self.parent_gui.append_file_path = file_path
             self.append_path_input.setText(file_path)
-            self.parent_gui.smelting_tab.append_path_input.setText(file_path)
+            self.parent_gui.set_append_path_inputs(file_path, self)
             self.parent_gui.load_recipes()
             self.parent_gui.save_config()
 
@@ -159,22 +159,13 @@ class CraftingTableTab(QWidget):
 
             self.parent_gui.append_file_path = file_path
             self.append_path_input.setText(file_path)
-            self.parent_gui.smelting_tab.append_path_input.setText(file_path)
+            self.parent_gui.set_append_path_inputs(file_path, self)
             self.parent_gui.load_recipes()
             self.parent_gui.save_config()
 
     def update_append_path(self, text):
         self.parent_gui.append_file_path = text.strip() if text.strip() else None
-        self.parent_gui.smelting_tab.append_path_input.setText(text)
-
-    def extract_output_item(self, recipe):
-        for line in recipe.splitlines():
-            if "Item.of(" in line:
-                start = line.find("'") + 1
-                end = line.find("'", start)
-                if start > 0 and end > start:
-                    return line[start:end]
-        return "Unknown Recipe"
+        self.parent_gui.set_append_path_inputs(text, self)
 
     def generate_recipe(self):
         recipe_text = self.generate_recipe_text()
@@ -188,48 +179,5 @@ class CraftingTableTab(QWidget):
         if not any(any(row) for row in crafting_grid) or not output_item:
             return "Error: Please fill in input slots and set an output."
 
-        if self.is_shaped:
-            placeholder_grid = [[" " for _ in range(3)] for _ in range(3)]
-            mapping = {}
-            item_to_placeholder = {}
-            for row in range(3):
-                for col in range(3):
-                    if crafting_grid[row][col]:
-                        if crafting_grid[row][col] not in item_to_placeholder:
-                            placeholder = chr(ord('A') + len(item_to_placeholder))
-                            item_to_placeholder[crafting_grid[row][col]] = placeholder
-                            mapping[placeholder] = crafting_grid[row][col]
-                        placeholder_grid[row][col] = item_to_placeholder[crafting_grid[row][col]]
-
-            recipe_grid = ",\n".join([f"    '{''.join(row)}'" for row in placeholder_grid])
-            recipe_mappings = "\n".join([
-                f"    {key}: '{value}'" + ("," if idx < len(mapping) - 1 else "")
-                for idx, (key, value) in enumerate(mapping.items())
-            ])
-            return (
-                f"event.shaped(\n"
-                f"  Item.of('{output_item}', {self.output_quantity}),\n"
-                f"  [\n{recipe_grid}\n  ],\n"
-                f"  {{\n{recipe_mappings}\n  }}\n)"
-            )
-        else:
-            shapeless_inputs = {}
-            for row in range(3):
-                for col in range(3):
-                    if crafting_grid[row][col]:
-                        item = crafting_grid[row][col]
-                        shapeless_inputs[item] = shapeless_inputs.get(item, 0) + 1
-
-            items_list = list(shapeless_inputs.items())
-            recipe = (
-                f"event.shapeless(\n"
-                f"  Item.of('{output_item}', {self.output_quantity}),\n"
-                f"  [\n"
-            )
-            for idx, (item, count) in enumerate(items_list):
-                formatted_item = f"    '{count}x {item}'" if count > 1 else f"    '{item}'"
-                if idx < len(items_list) - 1:
-                    formatted_item += ","
-                recipe += formatted_item + "\n"
-            recipe += "  ]\n)"
-            return recipe
\ No newline at end of file
+        recipe = crafting_recipe(crafting_grid, output_item, self.output_quantity, self.is_shaped)
+        return render_recipe(recipe)
\ No newline at end of file
@@ -0,0 +1,143 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QSpinBox, QComboBox
+from PyQt6.QtCore import Qt
+from recipe_generator import processing_recipe, render_recipe
+from recipe_types import INPUT_SLOTS, tab_types
+
+class ProcessingTab(QWidget):
+    def __init__(self, shared_item_list, parent_gui):
+        super().__init__()
+        self.selected_item = None
+        self.output_quantity = 1
+        self.input_items = [None] * INPUT_SLOTS
+        self.output_item = None
+        self.item_list = shared_item_list
+        self.parent_gui = parent_gui
+        self.recipe_types = tab_types("processing")
+        self.recipe_type = self.recipe_types[0]
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        type_layout = QHBoxLayout()
+        type_layout.addWidget(QLabel("Recipe Type:"))
+        self.type_combo = QComboBox()
+        for recipe_type in self.recipe_types:
+            self.type_combo.addItem(recipe_type.title, recipe_type.kind)
+        self.type_combo.currentIndexChanged.connect(self.set_type)
+        type_layout.addWidget(self.type_combo)
+        layout.addLayout(type_layout)
+
+        slots_layout = QHBoxLayout()
+        self.input_slots = []
+        for i in range(INPUT_SLOTS):
+            slot = QLabel("")
+            slot.setStyleSheet("border: 2px solid gray; background-color: gray; min-width: 40px; min-height: 40px;")
+            slot.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            slot.mousePressEvent = lambda event, i=i: self.handle_input_click(event, i)
+            self.input_slots.append(slot)
+            slots_layout.addWidget(slot)
+
+        arrow_label = QLabel("→")
+        arrow_label.setStyleSheet("font-size: 24px; margin: 0 20px;")
+        slots_layout.addWidget(arrow_label)
+
+        self.output_slot = QLabel("")
+        self.output_slot.setStyleSheet(
+            "border: 2px solid black; background-color: gray; min-width: 40px; min-height: 40px;")
+        self.output_slot.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.output_slot.mousePressEvent = self.handle_output_click
+        slots_layout.addWidget(self.output_slot)
+        layout.addLayout(slots_layout)
+
+        quantity_layout = QHBoxLayout()
+        quantity_layout.addWidget(QLabel("Output Quantity (1-64):"))
+        self.quantity_spinbox = QSpinBox()
+        self.quantity_spinbox.setRange(1, 64)
+        self.quantity_spinbox.setValue(1)
+        self.quantity_spinbox.valueChanged.connect(self.update_output_quantity)
+        quantity_layout.addWidget(self.quantity_spinbox)
+        layout.addLayout(quantity_layout)
+
+        time_layout = QHBoxLayout()
+        self.time_label = QLabel("Processing Time (ticks, 0 = default):")
+        time_layout.addWidget(self.time_label)
+        self.time_spinbox = QSpinBox()
+        self.time_spinbox.setRange(0, 1000000)
+        time_layout.addWidget(self.time_spinbox)
+        layout.addLayout(time_layout)
+
+        self.reset_button = QPushButton("Reset")
+        self.reset_button.clicked.connect(self.reset_slots)
+        layout.addWidget(self.reset_button)
+
+        self.generate_button = QPushButton("Generate Recipe")
+        self.generate_button.clicked.connect(self.generate_recipe)
+        layout.addWidget(self.generate_button)
+
+        self.append_path_input = QLineEdit()
+        self.append_path_input.setPlaceholderText("Paste or select file path (e.g., recipes.js)")
+        if self.parent_gui.append_file_path:
+            self.append_path_input.setText(self.parent_gui.append_file_path)
+        self.append_path_input.textChanged.connect(self.update_append_path)
+
+        layout.addStretch(1)
+        self.setLayout(layout)
+        self.set_type(0)
+
+    def set_type(self, index):
+        self.recipe_type = self.recipe_types[index]
+        slots = self.recipe_type.input_slots()
+        for i, slot in enumerate(self.input_slots):
+            slot.setVisible(i < slots)
+            if i >= slots:
+                self.input_items[i] = None
+                slot.setText("")
+        has_time = self.recipe_type.has("time")
+        self.time_label.setVisible(has_time)
+        self.time_spinbox.setVisible(has_time)
+
+    def handle_input_click(self, event, i):
+        if event.button() == Qt.MouseButton.LeftButton and self.selected_item:
+            self.input_items[i] = self.selected_item
+            self.input_slots[i].setText(self.selected_item)
+        elif event.button() == Qt.MouseButton.RightButton:
+            self.input_items[i] = None
+            self.input_slots[i].setText("")
+
+    def handle_output_click(self, event):
+        if event.button() == Qt.MouseButton.LeftButton and self.selected_item:
+            self.output_item = self.selected_item
+            self.output_slot.setText(self.selected_item)
+        elif event.button() == Qt.MouseButton.RightButton:
+            self.output_item = None
+            self.output_slot.setText("")
+
+    def reset_slots(self):
+        self.input_items = [None] * INPUT_SLOTS
+        for slot in self.input_slots:
+            slot.setText("")
+        self.output_item = None
+        self.output_slot.setText("")
+        self.quantity_spinbox.setValue(1)
+        self.time_spinbox.setValue(0)
+
+    def update_output_quantity(self, value):
+        self.output_quantity = value
+
+    def update_append_path(self, text):
+        self.parent_gui.append_file_path = text.strip() if text.strip() else None
+
+    def generate_recipe(self):
+        recipe_text = self.generate_recipe_text()
+        if recipe_text:
+            self.parent_gui.result_display.setText(recipe_text)
+
+    def generate_recipe_text(self):
+        inputs = [item for item in self.input_items if item]
+        if not inputs or not self.output_item:
+            return "Error: Please set input and output items."
+
+        time = self.time_spinbox.value() if self.recipe_type.has("time") and self.time_spinbox.value() else None
+        recipe = processing_recipe(self.recipe_type.kind, inputs, self.output_item, self.output_quantity, time=time)
+        return render_recipe(recipe)
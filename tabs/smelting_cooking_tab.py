@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QSpinBox, QFileDialog
 from PyQt6.QtCore import Qt
-import os
+from recipe_generator import cooking_recipe, render_recipe
+from recipe_types import tab_types
 
 class SmeltingCookingTab(QWidget):
     def __init__(self, shared_item_list, parent_gui):
@@ -11,7 +12,6 @@ class SmeltingCookingTab(QWidget):
         self.output_item = None
         self.item_list = shared_item_list
         self.parent_gui = parent_gui
-        self.recipes = []
         self.mode = "smelting"
         self.xp = 0.0
         self.time = 20
@@ -41,12 +41,7 @@ class SmeltingCookingTab(QWidget):
         layout.addLayout(slots_layout)
 
         mode_layout = QHBoxLayout()
-        self.mode_buttons = {
-            "smelting": QPushButton("Smelting"),
-            "blasting": QPushButton("Blasting"),
-            "smoking": QPushButton("Smoking"),
-            "campfireCooking": QPushButton("Campfire Cooking")
-        }
+        self.mode_buttons = {recipe_type.kind: QPushButton(recipe_type.label) for recipe_type in tab_types("cooking")}
 
         for mode, button in self.mode_buttons.items():
             button.setCheckable(True)
@@ -156,80 +151,13 @@ class SmeltingCookingTab(QWidget):
         self.parent_gui.append_file_path = text.strip() if text.strip() else None
 
     def load_recipes(self):
-        if not self.parent_gui.append_file_path or not os.path.exists(self.parent_gui.append_file_path):
-            self.parent_gui.result_label.setText("No valid recipes file selected")
-            self.recipes = []
-            self.all_recipes = []
-            return
-
-        file_path = self.parent_gui.append_file_path
-        self.recipes = []
-        self.all_recipes = []
-
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        current_recipe = []
-        in_recipe = False
-
-        for line in content.splitlines():
-            stripped_line = line.strip()
-            if stripped_line.startswith("event.smelting(") or stripped_line.startswith("event.blasting(") or \
-                    stripped_line.startswith("event.smoking(") or stripped_line.startswith("event.campfireCooking("):
-                in_recipe = True
-                current_recipe = [line]
-            elif in_recipe:
-                current_recipe.append(line)
-                if stripped_line == ")":
-                    in_recipe = False
-                    recipe_text = "\n".join(current_recipe)
-                    self.recipes.append(recipe_text)
-                    self.all_recipes.append(recipe_text)
-
-        self.parent_gui.update_recipes_list()
-
-    def extract_output_item(self, recipe):
-        for line in recipe.splitlines():
-            if "Item.of(" in line:
-                start = line.find("'") + 1
-                end = line.find("'", start)
-                if start > 0 and end > start:
-                    return line[start:end]
-        return "Unknown Recipe"
+        self.parent_gui.load_recipes()
 
     def append_to_file(self):
-        recipe_text = self.parent_gui.result_display.toPlainText()
-        if not recipe_text or "Error:" in recipe_text:
-            return
-
-        if not self.parent_gui.append_file_path:
-            self.browse_and_load_recipes()
-            if not self.parent_gui.append_file_path:
-                return
-
-        if recipe_text in self.recipes:
-            self.parent_gui.result_label.setText("Recipe already exists in memory")
-            return
-
-        self.recipes.append(recipe_text)
-        self.all_recipes.append(recipe_text)
-        self.parent_gui.update_recipes_list()
-        self.parent_gui.result_label.setText("Recipe appended to memory (click Save to write to file)")
+        self.parent_gui.append_to_file()
 
     def delete_recipe(self):
-        selected_item = self.parent_gui.recipes_list.currentItem()
-        if not selected_item or not self.parent_gui.append_file_path:
-            self.parent_gui.result_label.setText("No recipe selected or file specified")
-            return
-
-        recipe_text = selected_item.data(Qt.ItemDataRole.UserRole)
-        if recipe_text in self.recipes:
-            self.recipes.remove(recipe_text)
-            self.all_recipes.remove(recipe_text)
-            self.parent_gui.recipes_list.takeItem(self.parent_gui.recipes_list.row(selected_item))
-            self.parent_gui.result_label.setText("Recipe removed from memory (click Save to update file)")
-        else:
-            self.parent_gui.result_label.setText("Recipe not found in memory")
+        self.parent_gui.delete_recipe()
 
     def generate_recipe(self):
         recipe_text = self.generate_recipe_text()
@@ -240,32 +168,9 @@ class SmeltingCookingTab(QWidget):
         if not self.input_item or not self.output_item:
             return "Error: Please set input and output items."
 
-        recipe = (
-            f"event.{self.mode}(\n"
-            f"  Item.of('{self.output_item}', {self.output_quantity}),\n"
-            f"  '{self.input_item}',\n"
-            f"  {self.xp},\n"
-            f"  {self.time}\n)"
-        )
-        return recipe
+        recipe = cooking_recipe(self.mode, self.input_item, self.output_item, self.output_quantity,
+                                self.xp, self.time)
+        return render_recipe(recipe)
 
     def save_recipes(self):
-        if not self.parent_gui.append_file_path:
-            self.parent_gui.result_label.setText("No file specified to save")
-            return
-
-        file_path = self.parent_gui.append_file_path
-        is_js = file_path.endswith('.js')
-        header = "ServerEvents.recipes(event => {\n" if is_js else "// Recipes\n"
-        footer = "})\n" if is_js else ""
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(header + "\n")
-            for i, recipe in enumerate(self.recipes):
-                if i > 0:
-                    f.write("\n\n\n\n\n")
-                f.write(f"  {recipe}\n")
-            if is_js:
-                f.write(footer)
-
-        self.parent_gui.result_label.setText(f"Recipes saved to {file_path}")
\ No newline at end of file
+        self.parent_gui.save_recipes()
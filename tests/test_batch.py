@@ -0,0 +1,24 @@
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch import run_sharded
+from recipe_parser import load_script
+
+
+def test_shards_without_valid_recipes_are_not_written(tmp_path):
+    spec_path = tmp_path / "specs.jsonl"
+    spec_path.write_text("\n".join([
+        '{"type": "smelting", "input": "minecraft:raw_iron", "output": "minecraft:iron_ingot"}',
+        '{"type": "bogus", "input": "x:a", "output": "x:b"}',
+        'not json',
+    ]) + "\n", encoding='utf-8')
+    out_dir = tmp_path / "out"
+    out = io.StringIO()
+    assert run_sharded(str(spec_path), str(out_dir), jobs=1, out=out) == 1
+    assert sorted(os.listdir(out_dir)) == ["minecraft.js"]
+    assert [recipe.output for recipe in load_script(str(out_dir / "minecraft.js"))] == ["minecraft:iron_ingot"]
+    assert "into 1 files" in out.getvalue()
+    assert "x.js, not written" in out.getvalue()
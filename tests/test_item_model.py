@@ -0,0 +1,43 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from item_model import ItemFile
+
+
+def write(file_path, data):
+    with open(file_path, 'wb') as f:
+        f.write(data)
+
+
+def test_reads_lines(tmp_path):
+    file_path = str(tmp_path / "items.txt")
+    for data in [b"a:b\nc:d\n", b"a:b\nc:d", b"a:b\r\nc:d\r\n"]:
+        write(file_path, data)
+        items = ItemFile(file_path)
+        assert list(items) == ["a:b", "c:d"]
+        assert [items[0], items[1], items[-1]] == ["a:b", "c:d", "c:d"]
+    write(file_path, b"")
+    assert len(ItemFile(file_path)) == 0
+
+
+def test_stale_offsets_are_recomputed(tmp_path):
+    file_path = str(tmp_path / "items.txt")
+    write(file_path, b"a:b\nc:d\ne:f\n")
+    offsets = ItemFile(file_path).offsets
+    write(file_path, b"a:bb\nc:d\n")
+    items = ItemFile(file_path, offsets)
+    assert items.offsets is not offsets
+    assert list(items) == ["a:bb", "c:d"]
+    assert ItemFile(file_path, items.offsets).offsets is items.offsets
+
+
+def test_rewrite_while_open_keeps_loaded_rows(tmp_path):
+    file_path = str(tmp_path / "items.txt")
+    write(file_path, b"a:b\nc:d\n")
+    items = ItemFile(file_path)
+    write(file_path, b"")
+    assert [items[0], items[1]] == ["a:b", "c:d"]
+    items.close()
+    assert items[1] == ""
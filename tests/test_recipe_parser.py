@@ -0,0 +1,58 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recipe_generator import render_recipe
+from recipe_parser import parse_script
+
+
+def wrap(body):
+    return "ServerEvents.recipes(event => {\n" + body + "\n})\n"
+
+
+def test_crafting_round_trip():
+    body = """  event.shaped(Item.of('minecraft:bucket', 1), ['A A', ' A '], {A: 'minecraft:iron_ingot'})
+  event.shapeless(Item.of('minecraft:torch', 4), ['minecraft:coal', '#forge:rods/wooden'])"""
+    shaped, shapeless = parse_script(wrap(body))
+    assert shaped.pattern == ('A A', ' A ')
+    assert shaped.key == (('A', 'minecraft:iron_ingot'),)
+    assert shapeless.inputs == ('minecraft:coal', '#forge:rods/wooden')
+    assert parse_script(wrap(render_recipe(shaped)))[0].key == shaped.key
+
+
+def test_unrepresentable_ingredients_stay_opaque():
+    bodies = [
+        "  event.shapeless('minecraft:redstone', [Ingredient.of('#forge:dusts').except('minecraft:redstone')])",
+        "  event.shaped('minecraft:chest', ['PPP', 'P P', 'PPP'], "
+        "{P: ['minecraft:oak_planks', 'minecraft:birch_planks']})",
+        "  event.shaped('minecraft:chest', ['A'], {A: Item.of('minecraft:iron_ingot').withNBT({a: 1})})",
+        "  event.shaped('minecraft:chest', ['A'], {A: Item.of('minecraft:iron_ingot', '{a:1}')})",
+        "  event.shapeless(output, [input])",
+        "  event.shaped('minecraft:chest', ['A'])",
+        "  event.smelting('minecraft:glass', Ingredient.of('#forge:sand').except('minecraft:red_sand'))",
+        "  event.smelting('minecraft:glass', 'minecraft:sand', XP, 200)",
+        "  event.smelting('minecraft:glass', 'minecraft:sand', 0.1, TIME)",
+        "  event.smelting('minecraft:glass', 'minecraft:sand').xp(0.1).cookingTime(TIME)",
+        "  event.smelting('minecraft:glass', 'minecraft:sand').xp()",
+        "  event.recipes.create.milling('minecraft:sand', 'minecraft:gravel').processingTime(T)",
+    ]
+    for body in bodies:
+        assert parse_script(wrap(body)) == [], body
+
+
+def test_numeric_literals_are_read():
+    body = """  event.smelting('minecraft:glass', 'minecraft:sand', 0.1, 200)
+  event.blasting('minecraft:glass', 'minecraft:red_sand').xp(-0.5).cookingTime(100)
+  event.recipes.create.milling('minecraft:sand', 'minecraft:gravel').processingTime(250)"""
+    smelting, blasting, milling = parse_script(wrap(body))
+    assert (smelting.xp, smelting.time) == (0.1, 200)
+    assert (blasting.xp, blasting.time) == (-0.5, 100)
+    assert milling.time == 250
+
+
+def test_chained_recipe_methods_are_kept():
+    body = "  event.shapeless('minecraft:stick', ['minecraft:oak_planks']).id('mod:stick')"
+    recipe, = parse_script(wrap(body))
+    assert recipe.chain == ".id('mod:stick')"
+    assert render_recipe(recipe).endswith(".id('mod:stick')")
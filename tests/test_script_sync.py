@@ -0,0 +1,181 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recipe_generator import cooking_recipe
+from recipe_model import RecipeStore
+from recipe_parser import read_script
+from script_sync import sync_script
+from script_writer import save_script
+
+LINES = [
+    "  event.smelting('minecraft:a', 'minecraft:raw_a').xp(0.1).cookingTime(200)",
+    "  event.smelting('minecraft:b', 'minecraft:raw_b').xp(0.2).cookingTime(200)",
+    "  event.smelting('minecraft:c', 'minecraft:raw_c').xp(0.3).cookingTime(200)",
+]
+
+
+def script(lines):
+    return ("ServerEvents.recipes(event => {\n" + "\n".join(lines) + "\n})\n").encode('utf-8')
+
+
+def write(file_path, content):
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
+
+def read(file_path):
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def load(tmp_path, content):
+    file_path = str(tmp_path / "recipes.js")
+    write(file_path, content)
+    store = RecipeStore()
+    store.load(read_script(file_path))
+    return store, file_path
+
+
+def change(store, file_path, content):
+    old_content = read(file_path)
+    write(file_path, content)
+    return sync_script(store, file_path, old_content, content)
+
+
+def net(report):
+    added = [recipe.output for recipe in report.added]
+    removed = [recipe.output for recipe in report.removed]
+    return sorted(set(added) - set(removed)), sorted(set(removed) - set(added))
+
+
+def by_output(store, output):
+    return next(recipe for recipe in store if recipe.output == output)
+
+
+def assert_in_sync(store, file_path):
+    fresh = read_script(file_path).recipes
+    assert sorted((recipe.span, recipe.output) for recipe in store if recipe.source == file_path) == \
+        sorted((recipe.span, recipe.output) for recipe in fresh)
+
+
+def assert_saves_cleanly(store, file_path):
+    recipe = by_output(store, "minecraft:a") if any(r.output == "minecraft:a" for r in store) else next(iter(store))
+    store.modify([recipe], lambda recipe: setattr(recipe, "time", 123) or True)
+    store.add(cooking_recipe("blasting", "minecraft:raw_z", "minecraft:z"))
+    save_script(store, file_path)
+    saved = {recipe.output: recipe for recipe in read_script(file_path).recipes}
+    assert saved[recipe.output].time == 123
+    assert "minecraft:z" in saved
+    assert sorted(saved) == sorted(recipe.output for recipe in store)
+    assert_in_sync(store, file_path)
+
+
+def test_edit_on_disk(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    b = by_output(store, "minecraft:b")
+    report = change(store, file_path, script([LINES[0], LINES[1].replace("raw_b", "raw_bb"), LINES[2]]))
+    assert [recipe.output for recipe in report.added] == ["minecraft:b"]
+    assert report.removed == [b] and report.conflicts == []
+    assert by_output(store, "minecraft:b").inputs == ("minecraft:raw_bb",)
+    assert_in_sync(store, file_path)
+    assert_saves_cleanly(store, file_path)
+
+
+def test_delete_on_disk(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    report = change(store, file_path, script([LINES[0], LINES[2]]))
+    assert net(report) == ([], ["minecraft:b"]) and report.conflicts == []
+    assert sorted(recipe.output for recipe in store) == ["minecraft:a", "minecraft:c"]
+    assert_in_sync(store, file_path)
+    assert_saves_cleanly(store, file_path)
+
+
+def test_append_on_disk(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    extra = "  event.blasting('minecraft:d', 'minecraft:raw_d')"
+    report = change(store, file_path, script(LINES + [extra]))
+    assert net(report) == (["minecraft:d"], []) and report.removed == []
+    assert_in_sync(store, file_path)
+    assert store.sources[file_path].insert_offset == by_output(store, "minecraft:d").span[1]
+    assert_saves_cleanly(store, file_path)
+
+
+def test_prepend_on_disk(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    extra = "  event.blasting('minecraft:d', 'minecraft:raw_d')"
+    report = change(store, file_path, script([extra] + LINES))
+    assert net(report) == (["minecraft:d"], []) and report.conflicts == []
+    assert_in_sync(store, file_path)
+    assert_saves_cleanly(store, file_path)
+
+
+def test_comment_insert_on_disk(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    a = by_output(store, "minecraft:a")
+    report = change(store, file_path, script([LINES[0], "  // note", LINES[1], "  /* block\n  comment */", LINES[2]]))
+    assert net(report) == ([], []) and report.conflicts == []
+    assert by_output(store, "minecraft:a") is a
+    assert_in_sync(store, file_path)
+    assert_saves_cleanly(store, file_path)
+
+
+def test_commenting_out_a_recipe(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    report = change(store, file_path, script([LINES[0], "  /*", LINES[1], "  */", LINES[2]]))
+    assert net(report) == ([], ["minecraft:b"])
+    assert_in_sync(store, file_path)
+
+
+def test_unsaved_edit_conflict(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    b = by_output(store, "minecraft:b")
+    store.modify([b], lambda recipe: setattr(recipe, "time", 50) or True)
+    report = change(store, file_path, script([LINES[0], LINES[1].replace("0.2", "0.9"), LINES[2]]))
+    assert len(report.conflicts) == 1 and "minecraft:b" in report.conflicts[0]
+    disk_b = by_output(store, "minecraft:b")
+    assert (disk_b.xp, disk_b.time, disk_b.dirty) == (0.9, 200, False)
+    assert_in_sync(store, file_path)
+
+
+def test_unsaved_edit_elsewhere_survives(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    c = by_output(store, "minecraft:c")
+    store.modify([c], lambda recipe: setattr(recipe, "time", 50) or True)
+    report = change(store, file_path, script([LINES[0].replace("0.1", "0.5"), LINES[1], LINES[2]]))
+    assert report.conflicts == []
+    assert by_output(store, "minecraft:c") is c and c.dirty
+    save_script(store, file_path)
+    saved = {recipe.output: recipe for recipe in read_script(file_path).recipes}
+    assert (saved["minecraft:a"].xp, saved["minecraft:c"].time) == (0.5, 50)
+
+
+def test_pending_delete_is_remapped(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    store.remove(by_output(store, "minecraft:c").id)
+    extra = "  event.blasting('minecraft:d', 'minecraft:raw_d')"
+    report = change(store, file_path, script([extra] + LINES))
+    assert report.conflicts == []
+    save_script(store, file_path)
+    assert sorted(recipe.output for recipe in read_script(file_path).recipes) == [
+        "minecraft:a", "minecraft:b", "minecraft:d"]
+
+
+def test_pending_delete_changed_on_disk_is_restored(tmp_path):
+    store, file_path = load(tmp_path, script(LINES))
+    store.remove(by_output(store, "minecraft:b").id)
+    report = change(store, file_path, script([LINES[0], LINES[1].replace("0.2", "0.9"), LINES[2]]))
+    assert len(report.conflicts) == 1
+    assert by_output(store, "minecraft:b").xp == 0.9
+    assert store.sources[file_path].removed_spans == []
+    assert_in_sync(store, file_path)
+
+
+def test_non_ascii_edit(tmp_path):
+    lines = ["  // généré"] + LINES
+    store, file_path = load(tmp_path, script(lines))
+    report = change(store, file_path, script(["  // généré à nouveau"] + lines[1:3] + [LINES[2].replace("c'", "ç'")]))
+    assert net(report) == (["minecraft:ç"], ["minecraft:c"]) and report.conflicts == []
+    assert_in_sync(store, file_path)
+    assert_saves_cleanly(store, file_path)
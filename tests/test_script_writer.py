@@ -0,0 +1,131 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from recipe_generator import cooking_recipe
+from recipe_model import RecipeStore
+from recipe_parser import load_script, read_script
+from script_writer import save_script
+
+SCRIPT = """ServerEvents.recipes(event => {
+  event.smelting('minecraft:iron_ingot', 'minecraft:raw_iron').xp(0.7).cookingTime(200)
+  event.smelting('minecraft:gold_ingot', 'minecraft:raw_gold').xp(1.0).cookingTime(200)
+})
+"""
+
+
+def write(file_path, text):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+def read(file_path):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def outputs(file_path):
+    return sorted(recipe.output for recipe in load_script(file_path))
+
+
+def test_delete_all_then_add(tmp_path):
+    file_path = str(tmp_path / "recipes.js")
+    write(file_path, SCRIPT)
+    store = RecipeStore()
+    store.load(read_script(file_path))
+
+    for recipe in list(store):
+        store.remove(recipe.id)
+    save_script(store, file_path)
+    assert outputs(file_path) == []
+    assert read(file_path).rstrip().endswith("})")
+
+    store.add(cooking_recipe("smelting", "mod:a", "mod:n10"))
+    store.add(cooking_recipe("smelting", "mod:b", "mod:n20"))
+    save_script(store, file_path)
+    content = read(file_path)
+    assert outputs(file_path) == ["mod:n10", "mod:n20"]
+    assert content.startswith("ServerEvents.recipes(event => {")
+    assert content.rstrip().endswith("})")
+    assert content.count("})") == 1
+
+
+def test_delete_one_then_add(tmp_path):
+    file_path = str(tmp_path / "recipes.js")
+    write(file_path, SCRIPT)
+    store = RecipeStore()
+    store.load(read_script(file_path))
+
+    gold = next(recipe for recipe in store if recipe.output == "minecraft:gold_ingot")
+    store.remove(gold.id)
+    save_script(store, file_path)
+    store.add(cooking_recipe("blasting", "mod:a", "mod:b"))
+    save_script(store, file_path)
+    assert outputs(file_path) == ["minecraft:iron_ingot", "mod:b"]
+    assert read(file_path).rstrip().endswith("})")
+
+
+def test_edit_keeps_spans_in_sync(tmp_path):
+    file_path = str(tmp_path / "recipes.js")
+    write(file_path, SCRIPT)
+    store = RecipeStore()
+    store.load(read_script(file_path))
+
+    iron = next(recipe for recipe in store if recipe.output == "minecraft:iron_ingot")
+    store.modify([iron], lambda recipe: setattr(recipe, "time", 100) or True)
+    save_script(store, file_path)
+    store.modify([iron], lambda recipe: setattr(recipe, "time", 50) or True)
+    save_script(store, file_path)
+    saved = {recipe.output: recipe for recipe in load_script(file_path)}
+    assert saved["minecraft:iron_ingot"].time == 50
+    assert saved["minecraft:gold_ingot"].time == 200
+    assert read(file_path).count("})") == 1
+
+
+def test_failed_patch_leaves_script_intact(tmp_path, monkeypatch):
+    import script_writer
+
+    file_path = str(tmp_path / "recipes.js")
+    padding = "".join(f"  // helper line {i}\n" for i in range(1000))
+    write(file_path, SCRIPT.replace("})\n", padding + "})\n"))
+    original = read(file_path)
+    store = RecipeStore()
+    store.load(read_script(file_path))
+    store.add(cooking_recipe("smelting", "mod:a", "mod:b"))
+
+    def failing_prefix(file_path, size):
+        yield b"partial"
+        raise OSError("disk full")
+
+    monkeypatch.setattr(script_writer, "copy_prefix", failing_prefix)
+    try:
+        save_script(store, file_path)
+    except OSError:
+        pass
+    assert read(file_path) == original
+    assert sorted(os.listdir(tmp_path)) == ["recipes.js"]
+
+    monkeypatch.undo()
+    save_script(store, file_path)
+    assert padding + "})\n" in read(file_path)
+    assert outputs(file_path) == ["minecraft:gold_ingot", "minecraft:iron_ingot", "mod:b"]
+
+
+def test_saving_into_unloaded_script_only_inserts(tmp_path):
+    file_path = str(tmp_path / "other.js")
+    write(file_path, SCRIPT)
+    store = RecipeStore()
+    recipe = cooking_recipe("smelting", "mod:a", "minecraft:iron_ingot")
+    recipe.source = file_path
+    store.add(recipe)
+    copy = cooking_recipe("smelting", "minecraft:raw_gold", "minecraft:gold_ingot", xp=1.0)
+    copy.source = file_path
+    store.add(copy)
+
+    save_script(store, file_path, store.ordered(file_path))
+    saved = load_script(file_path)
+    assert sorted(recipe.output for recipe in saved) == [
+        "minecraft:gold_ingot", "minecraft:iron_ingot", "minecraft:iron_ingot"]
+    assert "minecraft:raw_iron" in read(file_path)
+    assert store.sources[file_path].removed_spans == []
@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matcher import get_matcher
+from search_index import FUZZY_CUTOFF, ItemSearchIndex, SearchSession, normalize
+
+ITEMS = ["minecraft:stone", "minecraft:iron_ingot", "minecraft:iron_block", "minecraft:gold_ingot",
+         "create:brass_ingot", "create:brass_casing", "create:andesite_alloy", "mekanism:ingot_osmium",
+         "minecraft:cobblestone", "minecraft:oak_planks"]
+
+
+def baseline(search_text):
+    search_text = search_text.strip().lower()
+    exact, partial = [], []
+    matcher = get_matcher()
+    for i, item in enumerate(ITEMS):
+        key = normalize(item)
+        if all(term in key for term in search_text.split()):
+            exact.append((i, 100))
+        else:
+            score = matcher.score(search_text, key)
+            if score >= FUZZY_CUTOFF:
+                partial.append((i, score))
+    return [i for i, _ in sorted(exact + partial, key=lambda x: x[1], reverse=True)]
+
+
+def test_search_matches_baseline_loop():
+    index = ItemSearchIndex(ITEMS)
+    for query in ["ignot", "stnoe", "irno", "iron", "iron ingot", "brass", "xyzzy", "i", "ob"]:
+        assert list(index.search(query)) == baseline(query), query
+
+
+def test_type_ahead_matches_baseline_loop():
+    session = SearchSession(ItemSearchIndex(ITEMS))
+    query = "iron ignot"
+    for end in range(1, len(query) + 1):
+        assert list(session.search(query[:end])) == baseline(query[:end]), query[:end]
+
+
+def names(index, query):
+    return [ITEMS[i] for i in index.search(query)]
+
+
+def test_namespace_terms_narrow_without_dropping_matches():
+    index = ItemSearchIndex(ITEMS)
+    assert names(index, "create:casing") == ["create:brass_casing"]
+    assert names(index, "minecraft:ingot") == ["minecraft:iron_ingot", "minecraft:gold_ingot"]
+    assert names(index, "minecraft:iron_ingot")[0] == "minecraft:iron_ingot"
+    assert "minecraft:iron_ingot" in names(index, "minecraft:ignot")
+    assert all(name.startswith("minecraft:") for name in names(index, "minecraft:ignot"))
+    assert names(index, "create:") == ["create:brass_ingot", "create:brass_casing", "create:andesite_alloy"]
+
+
+def test_mod_and_tag_scopes():
+    tags = {"#forge:ingots": {"minecraft:iron_ingot", "minecraft:gold_ingot", "#forge:ingots/brass"},
+            "#forge:ingots/brass": {"create:brass_ingot"}}
+    index = ItemSearchIndex(ITEMS, tags=tags)
+    assert names(index, "mod:create") == ["create:brass_ingot", "create:brass_casing", "create:andesite_alloy"]
+    assert names(index, "mod:mek") == ["mekanism:ingot_osmium"]
+    assert names(index, "#forge:ingots") == ["minecraft:iron_ingot", "minecraft:gold_ingot", "create:brass_ingot"]
+    assert names(index, "#forge:ingots mod:create") == ["create:brass_ingot"]
+    assert names(index, "#forge:ingots gold") == ["minecraft:gold_ingot"]
+    assert names(index, "#forge:nope") == []
+    session = SearchSession(index)
+    assert [ITEMS[i] for i in session.search("mod:create brass")] == ["create:brass_ingot", "create:brass_casing"]
+
+
+def test_registry_is_built_on_first_scoped_query():
+    index = ItemSearchIndex(ITEMS, tags={"#forge:ingots": {"minecraft:iron_ingot"}})
+    index.search("iron ingot")
+    assert index.registry.namespaces is None
+    assert index.registry.expand("minecraft:iron_ingot") == {"minecraft:iron_ingot", "#forge:ingots"}
+    assert index.registry.namespaces is None
+    index.search("minecraft:iron")
+    assert index.registry.namespaces is not None
@@ -1,4 +1,5 @@
 import json
+import os
 
 def load_config():
     try:
@@ -14,4 +15,8 @@ def save_config(item_file_path, recipes_file_path):
         "recipes_file_path": recipes_file_path
     }
     with open("config.json", "w") as f:
-        json.dump(config, f)
\ No newline at end of file
+        json.dump(config, f)
+
+def file_signature(file_path):
+    stat = os.stat(file_path)
+    return stat.st_size, stat.st_mtime_ns
\ No newline at end of file
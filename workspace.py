@@ -0,0 +1,47 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from cache import cached_read_script, cached_script
+
+SCRIPT_EXTENSION = ".js"
+SKIPPED_DIRS = {"node_modules", ".cache", ".git"}
+
+
+def discover_scripts(root):
+    scripts = []
+    for directory, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIPPED_DIRS)
+        scripts.extend(os.path.join(directory, name) for name in sorted(files) if name.endswith(SCRIPT_EXTENSION))
+    return scripts
+
+
+def in_workspace(root, file_path):
+    root = os.path.abspath(root)
+    try:
+        return os.path.commonpath([root, os.path.abspath(file_path)]) == root
+    except ValueError:
+        return False
+
+
+def load_scripts(paths, jobs=None):
+    sources = {}
+    missing = []
+    for file_path in paths:
+        source = cached_script(file_path)
+        if source is None:
+            missing.append(file_path)
+        else:
+            sources[file_path] = source
+
+    if jobs == 1 or len(missing) <= 1:
+        for file_path in missing:
+            sources[file_path] = cached_read_script(file_path)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=multiprocessing.get_context("spawn")) as pool:
+            for file_path, source in zip(missing, pool.map(cached_read_script, missing)):
+                sources[file_path] = source
+    return [sources[file_path] for file_path in paths]
+
+
+def load_workspace(root, jobs=None):
+    return load_scripts(discover_scripts(root), jobs)